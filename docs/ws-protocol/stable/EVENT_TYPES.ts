@@ -146,12 +146,13 @@ export interface PlanCompleted extends EventProtocol {
   step_id: string;
   event: "plan.completed";
   content: {
-    tasks: Array<{
+    tasks?: Array<{
       id: string;
       title: string;
       description: string;
       estimated_duration_sec?: number;
     }>;
+    tasks_ref?: string; // digest of tasks; set when reference_tasks is enabled
   };
   metadata: {
     task_count: number;
@@ -225,13 +226,23 @@ export interface PlanCoercionError extends EventProtocol {
   };
 }
 
+export interface PlanCacheHit extends EventProtocol {
+  session_id: string;
+  event: "plan.cache_hit";
+  content: {
+    question: string;
+    task_count: number;
+  };
+}
+
 export type PlanEvent =
   | PlanStart
   | PlanCompleted
   | PlanStepCompleted
   | PlanValidationError
   | PlanCancelled
-  | PlanCoercionError;
+  | PlanCoercionError
+  | PlanCacheHit;
 
 // ============================================================================
 // Solver Events (Server → Client)
@@ -397,7 +408,15 @@ export interface PipelineCompleted extends EventProtocol {
   };
 }
 
-export type PipelineEvent = PipelineCompleted;
+export interface PipelineBatch extends EventProtocol {
+  session_id: string;
+  event: "pipeline.batch";
+  content: {
+    events: EventProtocol[];
+  };
+}
+
+export type PipelineEvent = PipelineCompleted | PipelineBatch;
 
 // ============================================================================
 // Agent Events (Server → Client)
@@ -805,6 +824,7 @@ export const PLAN_EVENTS = {
   VALIDATION_ERROR: "plan.validation_error" as const,
   CANCELLED: "plan.cancelled" as const,
   COERCION_ERROR: "plan.coercion_error" as const,
+  CACHE_HIT: "plan.cache_hit" as const,
 };
 
 export const SOLVER_EVENTS = {
@@ -855,4 +875,5 @@ export const AGGREGATE_EVENTS = {
 
 export const PIPELINE_EVENTS = {
   COMPLETED: "pipeline.completed" as const,
+  BATCH: "pipeline.batch" as const,
 };
@@ -1,9 +1,12 @@
 from .base import BaseAgent
+from .base import install_uvloop
 from .factory import create_react_agent
 from .factory import create_toolcall_agent
 from .factory import create_deep_agent
 from myagent.ws.plan_solver import (
+    CachedPlan,
     PlanAgent,
+    PlanCache,
     PlanContext,
     PlanSolveResult,
     PlanSolverPipeline,
@@ -18,11 +21,14 @@ from .toolcall import ToolCallAgent
 
 __all__ = [
     "BaseAgent",
+    "install_uvloop",
     "ReActAgent",
     "ToolCallAgent",
     "create_react_agent",  # Deprecated, use create_toolcall_agent
     "create_toolcall_agent",
     "PlanAgent",
+    "PlanCache",
+    "CachedPlan",
     "SolverAgent",
     "PlanContext",
     "SolverRunResult",
@@ -1,14 +1,60 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable
 from contextlib import asynccontextmanager
+from copy import copy
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from ..llm import LLM
+from ..llm_logger import get_llm_logger
 from ..logger import logger
 from ..schema import ROLE_TYPE, AgentState, Memory, Message, Role
 from ..stats import get_stats_manager
 
+# Plain-string role values for hot comparisons against Message.role
+_ROLE_USER = Role.USER.value
+_ROLE_ASSISTANT = Role.ASSISTANT.value
+_ROLE_TOOL = Role.TOOL.value
+
+_uvloop_hint_logged = False
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the default asyncio event loop policy.
+
+    Call once at service startup, before ``asyncio.run``. Requires the
+    optional ``fast`` extra (``pip install myagent[fast]``).
+
+    Returns:
+        True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+def _log_uvloop_hint() -> None:
+    """Emit a one-time debug hint when running on the default event loop."""
+    global _uvloop_hint_logged
+    if _uvloop_hint_logged:
+        return
+    _uvloop_hint_logged = True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if not type(loop).__module__.startswith("uvloop"):
+        logger.debug(
+            "Running on the default asyncio loop; call install_uvloop() at "
+            "startup for faster event-loop throughput."
+        )
+
 
 class BaseAgent(BaseModel, ABC):
     """Abstract base class for managing agent state and execution.
@@ -51,6 +97,26 @@ class BaseAgent(BaseModel, ABC):
     )
 
     duplicate_threshold: int = 1
+
+    # Memory compaction
+    memory_window: int | None = Field(
+        default=None,
+        description="Max messages kept before each step; None disables compaction",
+    )
+    memory_prefix_lock: int = Field(
+        default=2,
+        ge=0,
+        description="Leading messages kept verbatim so the prompt prefix stays stable",
+    )
+
+    speculative_next_step: bool = Field(
+        default=False,
+        description="Issue the next step's LLM call while the current step's bookkeeping finishes",
+    )
+    stream_steps: bool = Field(
+        default=False,
+        description="run() returns only the final response instead of joining every step summary; use run_stream() to observe steps",
+    )
     final_response: str | None = Field(
         None, description="Final response after execution"
     )
@@ -60,9 +126,30 @@ class BaseAgent(BaseModel, ABC):
         None, description="WebSocket session for real-time event streaming"
     )
 
-    class Config:
-        arbitrary_types_allowed = True
-        extra = "allow"  # Allow extra fields for flexibility in subclasses
+    # Occurrence count per assistant content, maintained incrementally by
+    # is_stuck(); str hashes are cached, so lookups stay O(1) per step.
+    _stuck_counts: Counter[str] = PrivateAttr(default_factory=Counter)
+    _stuck_last: str | None = PrivateAttr(default=None)
+    _stuck_count: int = PrivateAttr(default=0)
+    # (id of messages list, messages indexed, last indexed message)
+    _stuck_seen: tuple[int, int, Any] | None = PrivateAttr(default=None)
+
+    # In-flight speculative LLM call for the next step and the memory
+    # snapshot it was issued against
+    _speculative_task: asyncio.Task | None = PrivateAttr(default=None)
+    _speculative_key: tuple[int, int, Any] | None = PrivateAttr(default=None)
+
+    # Attribute writes in the step loop stay plain __dict__ updates
+    # (no assignment validation); schema build is deferred to first use.
+    # extra="allow" does not touch writes to declared fields (pydantic
+    # memoizes a per-field setattr handler); it is what lets factories pass
+    # extra_fields through and AgentSession rebind ``step`` on the instance.
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra="allow",  # Allow extra fields for flexibility in subclasses
+        validate_assignment=False,
+        defer_build=True,
+    )
 
     @model_validator(mode="after")
     def initialize_agent(self) -> "BaseAgent":
@@ -94,13 +181,18 @@ class BaseAgent(BaseModel, ABC):
         if not isinstance(new_state, AgentState):
             raise ValueError(f"Invalid state: {new_state}")
 
+        # No-op transition: nothing to swap or restore
+        if new_state is self.state:
+            yield
+            return
+
         previous_state = self.state
         self.state = new_state
         try:
             yield
-        except Exception as e:
+        except Exception:
             self.state = AgentState.ERROR  # Transition to ERROR on failure
-            raise e
+            raise
         finally:
             self.state = previous_state  # Revert to previous state
 
@@ -122,28 +214,24 @@ class BaseAgent(BaseModel, ABC):
         Raises:
             ValueError: If the role is unsupported.
         """
-        message_map = {
-            "user": Message.user_message,
-            "system": Message.system_message,
-            "assistant": Message.assistant_message,
-            "tool": lambda content, **kw: Message.tool_message(content, **kw),
-        }
-
-        if role not in message_map:
-            raise ValueError(f"Unsupported message role: {role}")
-
-        # Create message with appropriate parameters based on role
-        if role == "system":
-            # system_message only accepts content parameter
-            self.memory.add_message(message_map[role](content))
-        elif role == "tool":
-            # tool_message accepts all kwargs
-            kwargs = {"base64_image": base64_image, **kwargs}
-            self.memory.add_message(message_map[role](content, **kwargs))
-        else:
-            # user and assistant messages accept base64_image
-            kwargs = {"base64_image": base64_image}
-            self.memory.add_message(message_map[role](content, **kwargs))
+        # Validation and per-role argument shaping in one dispatch, most
+        # frequent roles first
+        match role:
+            case "assistant":
+                message = Message.assistant_message(content, base64_image=base64_image)
+            case "tool":
+                # tool_message takes name/tool_call_id from kwargs
+                message = Message.tool_message(
+                    content, base64_image=base64_image, **kwargs
+                )
+            case "user":
+                message = Message.user_message(content, base64_image=base64_image)
+            case "system":
+                # system_message only accepts content
+                message = Message.system_message(content)
+            case _:
+                raise ValueError(f"Unsupported message role: {role}")
+        self.memory.add_message(message)
 
     async def run(self, request: str | None = None) -> str:
         """Execute the agent's main loop asynchronously.
@@ -152,7 +240,38 @@ class BaseAgent(BaseModel, ABC):
             request: Optional initial user request to process.
 
         Returns:
-            A string summarizing the execution results.
+            A string summarizing the execution results, or only the final
+            response when stream_steps is set.
+
+        Raises:
+            RuntimeError: If the agent is not in IDLE state at start.
+        """
+        if self.stream_steps:
+            # Drop each step summary once yielded instead of holding them all
+            executed = False
+            async for _ in self.run_stream(request):
+                executed = True
+            if not executed:
+                return "No steps executed"
+            return self.final_response or ""
+
+        lines = [line async for line in self.run_stream(request)]
+        if not lines:
+            return "No steps executed"
+        return "\n".join(lines)
+
+    async def run_stream(self, request: str | None = None) -> AsyncIterator[str]:
+        """Execute the agent's main loop, yielding each step summary as it completes.
+
+        Same semantics as run(), which collects these lines; callers can
+        surface progress after the first step instead of after the last.
+
+        Args:
+            request: Optional initial user request to process.
+
+        Yields:
+            One summary line per executed step, plus the termination notice
+            if max steps were reached.
 
         Raises:
             RuntimeError: If the agent is not in IDLE state at start.
@@ -160,10 +279,13 @@ class BaseAgent(BaseModel, ABC):
         if self.state != AgentState.IDLE:
             raise RuntimeError(f"Cannot run agent from state: {self.state}")
 
+        _log_uvloop_hint()
+
         if request:
             self.update_memory("user", request)
 
-        results: list[str] = []
+        # Last (step number, result) pair; step is None for the termination notice
+        last_result: tuple[int | None, str] | None = None
         final_state = None
         stats_run_id: str | None = None
         stats = get_stats_manager()
@@ -181,14 +303,24 @@ class BaseAgent(BaseModel, ABC):
                     self.current_step < self.max_steps and self.state != AgentState.FINISHED
                 ):
                     self.current_step += 1
-                    logger.info(f"Executing step {self.current_step}/{self.max_steps}")
+                    logger.info("Executing step {}/{}", self.current_step, self.max_steps)
+                    self._compact_memory()
                     step_result = await self.step()
 
                     # Check for stuck state
                     if self.is_stuck():
                         self.handle_stuck_state()
 
-                    results.append(f"Step {self.current_step}: {step_result}")
+                    last_result = (self.current_step, step_result)
+
+                    if (
+                        self.speculative_next_step
+                        and self.state != AgentState.FINISHED
+                        and self.current_step < self.max_steps
+                    ):
+                        self._start_speculative_step()
+
+                    yield self._format_step_result(*last_result)
 
                 # Capture the final state before state_context reverts it
                 final_state = self.state
@@ -196,18 +328,21 @@ class BaseAgent(BaseModel, ABC):
                 if self.current_step >= self.max_steps:
                     self.current_step = 0
                     final_state = AgentState.IDLE
-                    results.append(f"Terminated: Reached max steps ({self.max_steps})")
+                    last_result = (
+                        None,
+                        f"Terminated: Reached max steps ({self.max_steps})",
+                    )
+                    yield self._format_step_result(*last_result)
 
-            # Set the final state after exiting state_context
+            # Set the end-of-run fields after state_context has exited, so
+            # its revert does not overwrite the final state
+            last_llm_response = self._get_last_llm_response()
+            if last_llm_response is None and last_result:
+                last_llm_response = self._format_step_result(*last_result)
+            self.final_response = last_llm_response
             if final_state:
                 self.state = final_state
 
-            last_llm_response = self._get_last_llm_response()
-            if last_llm_response is not None:
-                self.final_response = last_llm_response
-            else:
-                self.final_response = results[-1] if results else None
-
             # Finish stats recording before returning (success/terminated)
             try:
                 if stats_run_id:
@@ -225,8 +360,6 @@ class BaseAgent(BaseModel, ABC):
             except Exception:
                 pass
 
-            return "\n".join(results) if results else "No steps executed"
-
         except Exception:
             # Record failure in stats then re-raise
             try:
@@ -241,12 +374,74 @@ class BaseAgent(BaseModel, ABC):
                 pass
             raise
         finally:
+            self._cancel_speculative_step()
             # Clear active agent attribution on the LLM
             try:
                 if getattr(self.llm, "_active_agent_name", None) == self.name:
                     setattr(self.llm, "_active_agent_name", None)
             except Exception:
                 pass
+            # Persist buffered LLM call records for this run off the event loop
+            try:
+                get_llm_logger().schedule_flush()
+            except Exception:
+                pass
+
+    async def run_batch_async(
+        self, requests: list[str], max_concurrency: int | None = None
+    ) -> list[str]:
+        """Run independent requests concurrently on per-request clones.
+
+        Each request gets a copy of this agent (see ``_clone_for_request``)
+        with fresh memory and run state, so LLM round-trips overlap; the LLM
+        client is shared. This agent itself is left untouched.
+
+        Args:
+            requests: User requests to process.
+            max_concurrency: Optional cap on runs in flight, e.g. to stay
+                within provider rate limits. None runs all at once.
+
+        Returns:
+            The run() result for each request, in input order.
+        """
+        semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+        async def run_one(request: str) -> str:
+            clone = self._clone_for_request()
+            if semaphore is None:
+                return await clone.run(request)
+            async with semaphore:
+                return await clone.run(request)
+
+        return list(await asyncio.gather(*(run_one(r) for r in requests)))
+
+    def _clone_for_request(self) -> "BaseAgent":
+        """Return an IDLE shallow copy with empty memory and private state.
+
+        Subclasses holding resources that a run mutates or releases (e.g.
+        tools cleaned up at the end of a run) extend this to give the clone
+        its own copies.
+        """
+        clone = self.model_copy(
+            update={
+                "memory": Memory(max_messages=self.memory.max_messages),
+                "current_step": 0,
+                "state": AgentState.IDLE,
+                "final_response": None,
+            }
+        )
+        # model_copy shares private attrs (stuck counters, speculation); reset them
+        for name, private in self.__private_attributes__.items():
+            factory = private.default_factory
+            setattr(clone, name, factory() if factory else copy(private.default))
+        return clone
+
+    @staticmethod
+    def _format_step_result(step: int | None, result: str) -> str:
+        """Render one entry of the run() results list as a summary line."""
+        return result if step is None else f"Step {step}: {result}"
 
     @abstractmethod
     async def step(self) -> str:
@@ -264,13 +459,15 @@ class BaseAgent(BaseModel, ABC):
             "3) Skip to final answer if enough info available."
         )
 
-        # Stronger intervention - replace instead of append to ensure it's seen
+        # Stronger intervention - replace instead of append to ensure it's seen.
+        # Wrap only once: repeated detections must not grow the prompt.
         original_prompt = self.next_step_prompt or ""
-        self.next_step_prompt = (
-            f"{stuck_prompt}\n\nOriginal guide: {original_prompt}"
-            if original_prompt
-            else stuck_prompt
-        )
+        if not original_prompt.startswith(stuck_prompt):
+            self.next_step_prompt = (
+                f"{stuck_prompt}\n\nOriginal guide: {original_prompt}"
+                if original_prompt
+                else stuck_prompt
+            )
 
         # Also add a system message to memory for immediate impact
         system_msg = Message.system_message(
@@ -282,53 +479,139 @@ class BaseAgent(BaseModel, ABC):
             f"Agent {self.name} detected stuck state. Strong intervention applied."
         )
 
+    def _speculate_next_step(self) -> Awaitable[Any] | None:
+        """Return an awaitable issuing the next step's LLM call early.
+
+        Subclasses that support ``speculative_next_step`` override this to
+        prepare the next prompt and return the pending LLM call; the step then
+        claims it via ``_take_speculative_step``. Default: no speculation.
+        """
+        return None
+
+    def _memory_key(self) -> tuple[int, int, Any]:
+        messages = self.memory.messages
+        return (id(messages), len(messages), messages[-1] if messages else None)
+
+    def _start_speculative_step(self) -> None:
+        """Launch the next step's LLM call (speculation depth is capped at 1)."""
+        self._cancel_speculative_step()
+        # Compact now so the loop head does not invalidate the speculation
+        self._compact_memory()
+        awaitable = self._speculate_next_step()
+        if awaitable is None:
+            return
+        self._speculative_task = asyncio.ensure_future(awaitable)
+        self._speculative_key = self._memory_key()
+
+    def _take_speculative_step(self) -> asyncio.Task | None:
+        """Claim the speculative LLM call if memory is unchanged since it was issued."""
+        task, self._speculative_task = self._speculative_task, None
+        if task is None:
+            return None
+        if self._speculative_key != self._memory_key():
+            self._discard_task(task)
+            return None
+        return task
+
+    def _cancel_speculative_step(self) -> None:
+        task, self._speculative_task = self._speculative_task, None
+        if task is not None:
+            self._discard_task(task)
+
+    @staticmethod
+    def _discard_task(task: asyncio.Future) -> None:
+        """Cancel an unused task, consuming any error it already raised."""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
+    def _compact_memory(self) -> None:
+        """Drop middle turns once memory grows past ``memory_window``.
+
+        Keeps the first ``memory_prefix_lock`` messages byte-identical, so the
+        provider-side prompt cache prefix survives, and replaces the dropped
+        turns with a single marker. The tail is cut to half of the remaining
+        budget so compaction runs once per several steps rather than on every
+        step, which would shift the cached suffix each time.
+        """
+        window = self.memory_window
+        messages = self.memory.messages
+        if not window or len(messages) <= window:
+            return
+
+        prefix_len = min(self.memory_prefix_lock, len(messages))
+        # Tool results answering a call in the prefix belong to it; cutting
+        # them off would leave that call unanswered
+        while prefix_len < len(messages) and messages[prefix_len].role == _ROLE_TOOL:
+            prefix_len += 1
+        tail_size = max(1, (window - prefix_len - 1) // 2)
+        start = max(prefix_len, len(messages) - tail_size)
+        # Never start the tail with tool results: pull in the assistant
+        # message that issued the tool calls
+        while start > prefix_len and messages[start].role == _ROLE_TOOL:
+            start -= 1
+        if start <= prefix_len:
+            return
+
+        marker = Message.system_message("[earlier turns omitted]")
+        self.memory.messages = [*messages[:prefix_len], marker, *messages[start:]]
+        logger.debug(
+            f"Agent {self.name} compacted memory from {len(messages)} "
+            f"to {len(self.memory.messages)} messages"
+        )
+
     def is_stuck(self) -> bool:
         """Check if the agent is stuck in a loop by detecting duplicate assistant content"""
-        if len(self.memory.messages) < 2:
+        messages = self.memory.messages
+        if len(messages) < 2:
             return False
 
-        # Get all assistant messages with content
-        assistant_messages = [
-            msg
-            for msg in self.memory.messages
-            if msg.role == "assistant" and msg.content
-        ]
-
-        if len(assistant_messages) < 2:
+        # Index only messages appended since the last check; rebuild when the
+        # list was replaced, truncated, or its tail rewritten
+        seen = self._stuck_seen
+        start = 0
+        if (
+            seen is not None
+            and seen[0] == id(messages)
+            and 0 < seen[1] <= len(messages)
+            and messages[seen[1] - 1] is seen[2]
+        ):
+            start = seen[1]
+        else:
+            self._stuck_counts = Counter()
+            self._stuck_last = None
+            self._stuck_count = 0
+
+        counts = self._stuck_counts
+        for i in range(start, len(messages)):
+            msg = messages[i]
+            content = msg.content
+            if msg.role == _ROLE_ASSISTANT and content:
+                counts[content] += 1
+                self._stuck_last = content
+                self._stuck_count += 1
+        self._stuck_seen = (id(messages), len(messages), messages[-1])
+
+        if self._stuck_count < 2:
             return False
 
-        # Check the last assistant message for duplicates
-        last_assistant_message = assistant_messages[-1]
-
-        # Count identical content occurrences in previous assistant messages
-        duplicate_count = sum(
-            1
-            for msg in assistant_messages[:-1]  # Exclude the last one
-            if msg.content == last_assistant_message.content
-        )
+        # Earlier assistant messages with the same content as the last one
+        duplicate_count = counts[self._stuck_last] - 1
 
         return duplicate_count >= self.duplicate_threshold
 
     def _get_last_llm_response(self) -> str | None:
         """Return the most recent assistant message content from memory."""
-        for message in reversed(self.memory.messages):
-            if message.role == Role.ASSISTANT.value and message.content:
-                return message.content
-        return None
+        return self.memory.last_assistant_content()
 
     def _get_last_user_message(self) -> Message | None:
         """Return the most recent user message from memory."""
-        for message in reversed(self.memory.messages):
-            if message.role == Role.USER.value:
-                return message
-        return None
+        return self.memory.last_message(_ROLE_USER)
 
     def _get_last_assistant_message(self) -> Message | None:
         """Return the most recent assistant message from memory."""
-        for message in reversed(self.memory.messages):
-            if message.role == Role.ASSISTANT.value:
-                return message
-        return None
+        return self.memory.last_message(_ROLE_ASSISTANT)
 
     @property
     def messages(self) -> list[Message]:
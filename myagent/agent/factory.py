@@ -10,6 +10,15 @@ from .toolcall import ToolCallAgent
 from .base import BaseAgent
 
 
+_TERMINATE_NAME = Terminate.model_fields["name"].default
+
+# ToolChoice members and their raw string values, mapped to the string value
+_TOOL_CHOICE_VALUES: dict[str, str] = {
+    **{choice.value: choice.value for choice in ToolChoice},
+    **{choice: choice.value for choice in ToolChoice},
+}
+
+
 def _ensure_tool_collection(
     tools: Sequence[BaseTool] | ToolCollection | None,
 ) -> ToolCollection:
@@ -17,9 +26,9 @@ def _ensure_tool_collection(
         collection = tools
     else:
         collection = ToolCollection(*(tools or ()))
-    terminate_tool = Terminate()
-    if not collection.get_tool(terminate_tool.name):
-        collection.add_tool(terminate_tool)
+    # Only build a Terminate tool when the collection lacks one
+    if not collection.get_tool(_TERMINATE_NAME):
+        collection.add_tool(Terminate())
     return collection
 
 
@@ -64,17 +73,20 @@ def create_toolcall_agent(
         tool_choice_value: TOOL_CHOICE_TYPE = cast(
             "TOOL_CHOICE_TYPE", ToolChoice.AUTO.value
         )
-    elif isinstance(tool_choice, ToolChoice):
-        tool_choice_value = cast("TOOL_CHOICE_TYPE", tool_choice.value)
     else:
-        try:
-            tool_choice_value = cast("TOOL_CHOICE_TYPE", ToolChoice(tool_choice).value)
-        except ValueError as exc:
-            raise ValueError(f"Unsupported tool choice: {tool_choice}") from exc
+        normalized = (
+            _TOOL_CHOICE_VALUES.get(tool_choice)
+            if isinstance(tool_choice, str)
+            else None
+        )
+        if normalized is None:
+            raise ValueError(f"Unsupported tool choice: {tool_choice}")
+        tool_choice_value = cast("TOOL_CHOICE_TYPE", normalized)
 
     agent_kwargs = {
         "name": name,
-        "llm": llm if llm is not None else LLM(config_name=name.lower()),
+        # None lets ToolCallAgent.initialize_agent build LLM(config_name=name.lower())
+        "llm": llm,
         "available_tools": tool_collection,
         "tool_choices": tool_choice_value,
     }
@@ -178,13 +190,10 @@ def create_deep_agent(
     # Combine with additional tools
     all_tools = deep_tools + (tools or [])
 
-    # Create LLM instance (LLM uses config_name, not keyword arguments)
-    llm = LLM(config_name=name.lower())
-
-    # Create base agent using create_toolcall_agent directly
+    # Create base agent using create_toolcall_agent directly; the agent
+    # builds its LLM from config_name=name.lower()
     agent = create_toolcall_agent(
         name=name,
-        llm=llm,
         tools=all_tools
     )
 
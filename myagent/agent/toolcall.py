@@ -1,6 +1,8 @@
 import asyncio
 import json
 import os
+from collections.abc import AsyncIterator
+from copy import copy
 from typing import Any
 
 from pydantic import Field
@@ -44,8 +46,8 @@ class ToolCallAgent(ReActAgent):
     max_steps: int = 30
     max_observe: int | bool | None = None
 
-    async def think(self) -> bool:
-        """Process current state and decide next actions using tools"""
+    def _prepare_next_step_messages(self) -> None:
+        """Fold next_step_prompt into memory before an LLM call (idempotent)."""
         # Check if we need to add next_step_prompt to the last user message
         if self.next_step_prompt and self.messages:
             last_msg = self.messages[-1]
@@ -66,18 +68,35 @@ class ToolCallAgent(ReActAgent):
                 user_msg = Message.user_message(self.next_step_prompt)
                 self.messages += [user_msg]
 
+    def _ask_tool(self):
+        """Issue the tool-selection LLM call for the current memory."""
+        return self.llm.ask_tool(
+            messages=list(self.messages),
+            system_msgs=(
+                [Message.system_message(self.system_prompt)]
+                if self.system_prompt
+                else None
+            ),
+            tools=self.available_tools.to_params(),
+            tool_choice=self.tool_choices,
+        )
+
+    def _speculate_next_step(self):
+        """Prepare the next prompt and start its LLM call ahead of think()."""
+        self._prepare_next_step_messages()
+        return self._ask_tool()
+
+    async def think(self) -> bool:
+        """Process current state and decide next actions using tools"""
+        self._prepare_next_step_messages()
+        speculative = self._take_speculative_step()
+
         try:
             # Get response with tool options
-            response = await self.llm.ask_tool(
-                messages=self.messages,
-                system_msgs=(
-                    [Message.system_message(self.system_prompt)]
-                    if self.system_prompt
-                    else None
-                ),
-                tools=self.available_tools.to_params(),
-                tool_choice=self.tool_choices,
-            )
+            if speculative is not None:
+                response = await speculative
+            else:
+                response = await self._ask_tool()
         except ValueError:
             raise
         except Exception as e:
@@ -107,16 +126,15 @@ class ToolCallAgent(ReActAgent):
         # Send LLM_MESSAGE event after LLM call
         await self._send_llm_message_event()
 
-        # Log response info
-        logger.info(f"✨ {self.name}'s thoughts: {content}")
-        logger.info(
-            f"🛠️ {self.name} selected {len(tool_calls) if tool_calls else 0} tools to use"
-        )
+        # Log response info; arguments are formatted only if INFO is enabled
+        logger.info("✨ {}'s thoughts: {}", self.name, content)
+        logger.info("🛠️ {} selected {} tools to use", self.name, len(tool_calls))
         if tool_calls:
-            logger.info(
-                f"🧰 Tools being prepared: {[call.function.name for call in tool_calls]}"
+            logger.opt(lazy=True).info(
+                "🧰 Tools being prepared: {}",
+                lambda: [call.function.name for call in tool_calls],
             )
-            logger.info(f"🔧 Tool arguments: {tool_calls[0].function.arguments}")
+            logger.info("🔧 Tool arguments: {}", tool_calls[0].function.arguments)
 
         try:
             if response is None:
@@ -208,7 +226,7 @@ class ToolCallAgent(ReActAgent):
             args = json.loads(command.function.arguments or "{}")
 
             # Execute the tool
-            logger.info(f"🔧 Activating tool: '{name}'..., {type(args)}")
+            logger.info("🔧 Activating tool: '{}'..., {}", name, type(args))
             result = await self.available_tools.execute(name=name, tool_input=args)
 
             # Handle special tools
@@ -673,6 +691,20 @@ class ToolCallAgent(ReActAgent):
             except Exception as e:
                 logger.error(f"Failed to send LLM_MESSAGE event: {e}")
 
+    def _clone_for_request(self) -> "ToolCallAgent":
+        """Return a clone that owns copies of this agent's tools.
+
+        run_stream() cleans up every tool when it ends, so clones running
+        side by side must not share tool instances with each other or with
+        this agent. The copies are shallow: tools should open per-run
+        resources on first use rather than when constructed.
+        """
+        clone = super()._clone_for_request()
+        clone.available_tools = ToolCollection(
+            *(copy(tool) for tool in self.available_tools)
+        )
+        return clone
+
     async def cleanup(self):
         """Clean up resources used by the agent's tools."""
         logger.info(f"🧹 Cleaning up resources for agent '{self.name}'...")
@@ -689,18 +721,17 @@ class ToolCallAgent(ReActAgent):
                     )
         logger.info(f"✨ Cleanup complete for agent '{self.name}'.")
 
-    async def run(self, request: str | None = None) -> str:
-        """Run the agent with cleanup when done."""
+    async def run_stream(self, request: str | None = None) -> AsyncIterator[str]:
+        """Run the agent with cleanup when done, yielding each step summary."""
         try:
-            result = await super().run(request)
-            
+            async for line in super().run_stream(request):
+                yield line
+
             # Check if we reached max steps and need to generate summary
             if self.current_step >= self.max_steps and self.state != AgentState.FINISHED:
                 logger.info(f"🏁 Reached max steps ({self.max_steps}), generating final summary...")
                 await self._generate_final_summary()
                 await self._send_llm_message_event()
                 self.state = AgentState.FINISHED
-            
-            return result
         finally:
             await self.cleanup()
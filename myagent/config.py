@@ -1,4 +1,6 @@
+import math
 import os
+import warnings
 from typing import Any
 from typing import ClassVar
 from typing import Optional
@@ -10,6 +12,25 @@ from pydantic import Field
 load_dotenv(".env")
 
 
+def _sample_rate_from_env(name: str, default: float = 1.0) -> float:
+    """Read a sampling fraction from the environment, clamped to [0, 1].
+
+    Malformed or non-finite values fall back to ``default`` with a warning
+    rather than failing at import.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        rate = float(raw)
+    except ValueError:
+        rate = math.nan
+    if not math.isfinite(rate):
+        warnings.warn(f"Ignoring invalid {name}={raw!r}; using {default}", stacklevel=2)
+        return default
+    return min(1.0, max(0.0, rate))
+
+
 class LLMSettings(BaseModel):
     model: str = Field(default_factory=lambda: os.getenv("LLM_MODEL", "gpt-3.5-turbo"))
     base_url: str = Field(
@@ -53,6 +74,11 @@ class Settings(BaseModel):
         description="Settings for the language model including model name, API key, and other parameters",
     )
 
+    # Fraction of LLM calls recorded by the LLM call logger (1.0 logs all)
+    LLM_LOG_SAMPLE_RATE: float = Field(
+        default_factory=lambda: _sample_rate_from_env("LLM_LOG_SAMPLE_RATE")
+    )
+
     # Embedding settings
     EMBEDDING_MODEL: str = Field(
         default_factory=lambda: os.getenv("EMBEDDING_MODEL", "Pro/BAAI/bge-m3")
@@ -19,6 +19,7 @@ from tenacity import wait_random_exponential
 from .config import LLMSettings
 from .config import settings
 from .exceptions import TokenLimitExceeded
+from .llm_logger import LLMCallLogger
 from .llm_logger import get_llm_logger
 from .logger import logger  # Assuming a logger is set up in your app
 from .schema import ROLE_VALUES
@@ -26,6 +27,8 @@ from .schema import TOOL_CHOICE_TYPE
 from .schema import TOOL_CHOICE_VALUES
 from .schema import Message
 from .schema import ToolChoice
+from .stats import StatsManager
+from .stats import get_stats_manager
 
 try:
     from .trace import RunType
@@ -189,7 +192,7 @@ class LLM:
     def __init__(
         self, config_name: str = "default", llm_config: LLMSettings | None = None
     ):
-        if not hasattr(self, "client"):  # Only initialize if not already initialized
+        if not hasattr(self, "model"):  # Only initialize if not already initialized
             llm_config = llm_config or settings.llm_settings
             self.model = llm_config.model
             self.max_tokens = llm_config.max_tokens
@@ -210,21 +213,52 @@ class LLM:
                 else None
             )
 
-            # Initialize tokenizer
+            # Tokenizer and API client are built on first use, so agents that
+            # never call the model skip tiktoken loading and client setup
+            self._tokenizer = None
+            self._client = None
+            self._token_counter: TokenCounter | None = None
+
+            # Process-wide stats and call log singletons, resolved on first call
+            self._stats: StatsManager | None = None
+            self._call_logger: LLMCallLogger | None = None
+
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
             try:
-                self.tokenizer = tiktoken.encoding_for_model(self.model)
+                self._tokenizer = tiktoken.encoding_for_model(self.model)
             except KeyError:
                 # If the model is not in tiktoken's presets, use cl100k_base as default
-                self.tokenizer = tiktoken.get_encoding("cl100k_base")
-
+                self._tokenizer = tiktoken.get_encoding("cl100k_base")
+        return self._tokenizer
+
+    @tokenizer.setter
+    def tokenizer(self, value) -> None:
+        self._tokenizer = value
+        self._token_counter = None
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        if self._token_counter is None:
+            self._token_counter = TokenCounter(self.tokenizer)
+        return self._token_counter
+
+    @property
+    def client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
+        if self._client is None:
             if self.api_type == "azure":
-                self.client = AsyncAzureOpenAI(
+                self._client = AsyncAzureOpenAI(
                     base_url=self.base_url,
                     api_key=self.api_key,
                     api_version=self.api_version,
                 )
-            self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-            self.token_counter = TokenCounter(self.tokenizer)
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._client
+
+    @client.setter
+    def client(self, value: AsyncOpenAI | AsyncAzureOpenAI) -> None:
+        self._client = value
 
     def count_tokens(self, text: str) -> int:
         """Calculate the number of tokens in a text"""
@@ -290,10 +324,10 @@ class LLM:
 
         # Also update global stats manager aggregates
         try:
-            from .stats import get_stats_manager
-
+            if self._stats is None:
+                self._stats = get_stats_manager()
             agent_name = getattr(self, "_active_agent_name", None)
-            get_stats_manager().record_llm_call(
+            self._stats.record_llm_call(
                 model=getattr(self, "model", None),
                 call_type=call_type,
                 input_tokens=metadata.get("input_tokens", 0),
@@ -313,8 +347,9 @@ class LLM:
     ) -> None:
         """Persist call details and store them in memory for statistics."""
         metadata = metadata or {}
-        llm_logger = get_llm_logger()
-        llm_logger.log_llm_call(
+        if self._call_logger is None:
+            self._call_logger = get_llm_logger()
+        self._call_logger.log_llm_call(
             model=self.model,
             messages=messages,
             response=response,
@@ -427,55 +462,21 @@ class LLM:
         formatted_messages = []
 
         for message in messages:
-            # Convert Message objects to dictionaries
             if isinstance(message, Message):
-                message = message.to_dict()
-
-            if isinstance(message, dict):
-                # If message is a dict, ensure it has required fields
-                if "role" not in message:
-                    raise ValueError("Message dict must contain 'role' field")
-
-                # Process base64 images if present and model supports images
-                if supports_images and message.get("base64_image"):
-                    # Initialize or convert content to appropriate format
-                    if not message.get("content"):
-                        message["content"] = []
-                    elif isinstance(message["content"], str):
-                        message["content"] = [
-                            {"type": "text", "text": message["content"]}
-                        ]
-                    elif isinstance(message["content"], list):
-                        # Convert string items to proper text objects
-                        message["content"] = [
-                            (
-                                {"type": "text", "text": item}
-                                if isinstance(item, str)
-                                else item
-                            )
-                            for item in message["content"]
-                        ]
-
-                    # Add the image to content
-                    message["content"].append(
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{message['base64_image']}"
-                            },
-                        }
-                    )
-
-                    # Remove the base64_image field
-                    del message["base64_image"]
-                # If model doesn't support images but message has base64_image, handle gracefully
-                elif not supports_images and message.get("base64_image"):
-                    # Just remove the base64_image field and keep the text content
-                    del message["base64_image"]
-
-                if "content" in message or "tool_calls" in message:
-                    formatted_messages.append(message)
-                # else: do not include the message
+                # Each Message is converted once per image mode and reused on
+                # later calls; the copies handed out are safe to edit
+                formatted = message._cached_dict(
+                    supports_images,
+                    lambda message=message: LLM._format_message_dict(
+                        message.to_dict(), supports_images
+                    ),
+                )
+                if formatted is not None:
+                    formatted_messages.append(formatted)
+            elif isinstance(message, dict):
+                formatted = LLM._format_message_dict(message, supports_images)
+                if formatted is not None:
+                    formatted_messages.append(formatted)
             else:
                 raise TypeError(f"Unsupported message type: {type(message)}")
 
@@ -486,6 +487,55 @@ class LLM:
 
         return formatted_messages
 
+    @staticmethod
+    def _format_message_dict(message: dict, supports_images: bool) -> dict | None:
+        """Format one message dict in place; None if it carries no payload."""
+        # If message is a dict, ensure it has required fields
+        if "role" not in message:
+            raise ValueError("Message dict must contain 'role' field")
+
+        # Process base64 images if present and model supports images
+        if supports_images and message.get("base64_image"):
+            # Initialize or convert content to appropriate format
+            if not message.get("content"):
+                message["content"] = []
+            elif isinstance(message["content"], str):
+                message["content"] = [
+                    {"type": "text", "text": message["content"]}
+                ]
+            elif isinstance(message["content"], list):
+                # Convert string items to proper text objects
+                message["content"] = [
+                    (
+                        {"type": "text", "text": item}
+                        if isinstance(item, str)
+                        else item
+                    )
+                    for item in message["content"]
+                ]
+
+            # Add the image to content
+            message["content"].append(
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/jpeg;base64,{message['base64_image']}"
+                    },
+                }
+            )
+
+            # Remove the base64_image field
+            del message["base64_image"]
+        # If model doesn't support images but message has base64_image, handle gracefully
+        elif not supports_images and message.get("base64_image"):
+            # Just remove the base64_image field and keep the text content
+            del message["base64_image"]
+
+        if "content" in message or "tool_calls" in message:
+            return message
+        # else: do not include the message
+        return None
+
     @retry(
         wait=wait_random_exponential(min=1, max=60),
         stop=stop_after_attempt(6),
@@ -553,7 +603,7 @@ class LLM:
 
             # Calculate input token count
             input_tokens = self.count_message_tokens(messages)
-            logger.info(f"Input tokens for request: {input_tokens}")
+            logger.info("Input tokens for request: {}", input_tokens)
 
             # Check if token limits are exceeded
             if not self.check_token_limit(input_tokens):
@@ -727,7 +777,7 @@ class LLM:
             multimodal_content = (
                 [{"type": "text", "text": content}]
                 if isinstance(content, str)
-                else content
+                else list(content)
                 if isinstance(content, list)
                 else []
             )
@@ -981,7 +1031,7 @@ class LLM:
             )
 
             message_content = response.choices[0].message.content or "[Tool Call]"
-            logger.info(f"LLM Response Content: {message_content}")
+            logger.info("LLM Response Content: {}", message_content)
             tool_calls = response.choices[0].message.tool_calls
             if tool_calls:
                 message_content += f" Tools: {[tc.function.name for tc in tool_calls]}"
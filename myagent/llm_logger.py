@@ -6,7 +6,11 @@ This module provides logging functionality for all large language model
 interactions, recording inputs, outputs, and metadata for analysis and debugging.
 """
 
+import atexit
 import json
+import random
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
@@ -22,21 +26,42 @@ class LLMCallLogger:
     language models, including request/response pairs, token counts, and
     metadata for performance analysis and debugging.
 
+    Records are buffered in memory and written to disk in batches, since
+    each write rewrites the whole JSON file. Batches are written by a single
+    background thread so the event loop never blocks on file I/O.
+
+    Calls can be head-sampled: unsampled calls return before any record is
+    built, so production setups can keep the log without paying for it on
+    every call.
+
     Attributes:
         log_file_path: Path to the JSON log file
+        batch_size: Number of buffered records that triggers a flush
+        sample_rate: Fraction of calls that are recorded
     """
 
-    def __init__(self, log_file_path: str = "workdir/llm_response.json"):
+    def __init__(
+        self,
+        log_file_path: str = "workdir/llm_response.json",
+        batch_size: int = 16,
+        sample_rate: float = 1.0,
+    ):
         """Initialize the LLM call logger.
 
         Args:
             log_file_path: Path to store the log file
+            batch_size: Number of buffered records that triggers a flush
+            sample_rate: Fraction of calls to record, between 0.0 and 1.0
         """
         self.log_file_path = Path(log_file_path)
         self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
 
         # Thread lock for concurrent write safety
         self._lock = Lock()
+        self._pending: list[dict[str, Any]] = []
+        self._writer: ThreadPoolExecutor | None = None
 
         # Initialize log file
         self._initialize_log_file()
@@ -62,6 +87,8 @@ class LLMCallLogger:
             response: The response text from the model
             metadata: Optional additional metadata
         """
+        if not self.should_sample():
+            return
         try:
             # Create call record
             call_record = {
@@ -76,9 +103,12 @@ class LLMCallLogger:
                 },
             }
 
-            # Thread-safe file writing
+            # Buffer the record; hand full batches to the writer thread
             with self._lock:
-                self._append_to_log_file(call_record)
+                self._pending.append(call_record)
+                batch_full = len(self._pending) >= self.batch_size
+            if batch_full:
+                self.schedule_flush()
 
             logger.debug(
                 f"LLM call logged: {model}, "
@@ -89,12 +119,55 @@ class LLMCallLogger:
         except Exception as e:
             logger.error(f"Failed to log LLM call: {e}")
 
-    def _append_to_log_file(self, record: dict[str, Any]):
-        """Append a record to the log file.
+    def should_sample(self) -> bool:
+        """Return whether the next call should be recorded."""
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def schedule_flush(self) -> Future | None:
+        """Hand buffered records to the writer thread without blocking.
+
+        Returns:
+            Future for the write, or None if nothing was scheduled
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            records, self._pending = self._pending, []
+            return self._submit_locked(records)
+
+    def flush(self):
+        """Write all buffered records and wait for pending writes to finish."""
+        with self._lock:
+            records, self._pending = self._pending, []
+            future = self._submit_locked(records)
+        if future is not None:
+            future.result()
+
+    def _submit_locked(self, records: list[dict[str, Any]]) -> Future | None:
+        """Queue a write on the writer thread; caller must hold the lock.
+
+        Submission order under the lock keeps batches in order on disk. Falls
+        back to writing inline once the interpreter is shutting down.
+        """
+        try:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="llm-call-logger"
+                )
+            return self._writer.submit(self._append_to_log_file, records)
+        except RuntimeError:
+            self._append_to_log_file(records)
+            return None
+
+    def _append_to_log_file(self, records: list[dict[str, Any]]):
+        """Append records to the log file.
 
         Args:
-            record: The log record to append
+            records: The log records to append
         """
+        if not records:
+            return
         try:
             # Read existing records
             if self.log_file_path.exists():
@@ -103,8 +176,8 @@ class LLMCallLogger:
             else:
                 existing_records = []
 
-            # Add new record
-            existing_records.append(record)
+            # Add new records
+            existing_records.extend(records)
 
             # Write back to file
             with open(self.log_file_path, "w", encoding="utf-8") as f:
@@ -138,6 +211,7 @@ class LLMCallLogger:
         Returns:
             Dictionary containing usage statistics
         """
+        self.flush()
         try:
             if not self.log_file_path.exists():
                 return {
@@ -199,6 +273,7 @@ class LLMCallLogger:
     def clear_logs(self):
         """Clear all log records."""
         try:
+            self.flush()
             with self._lock:
                 with open(self.log_file_path, "w", encoding="utf-8") as f:
                     json.dump([], f, ensure_ascii=False, indent=2)
@@ -215,6 +290,7 @@ class LLMCallLogger:
         Returns:
             List of recent call records, sorted by timestamp (newest first)
         """
+        self.flush()
         try:
             if not self.log_file_path.exists():
                 return []
@@ -245,5 +321,8 @@ def get_llm_logger() -> LLMCallLogger:
     """
     global _llm_call_logger
     if _llm_call_logger is None:
-        _llm_call_logger = LLMCallLogger()
+        from .config import settings
+
+        _llm_call_logger = LLMCallLogger(sample_rate=settings.LLM_LOG_SAMPLE_RATE)
+        atexit.register(_llm_call_logger.flush)
     return _llm_call_logger
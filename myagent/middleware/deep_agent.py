@@ -203,6 +203,9 @@ def create_deep_agent(
     """
     Create a new Deep Agent with all capabilities enabled.
     
+    Kept for backward compatibility; delegates to
+    ``myagent.agent.factory.create_deep_agent``.
+    
     Args:
         tools: Additional tools beyond Deep Agent built-ins
         llm_config: LLM configuration
@@ -213,41 +216,11 @@ def create_deep_agent(
         Configured Deep Agent
     """
     # Import locally to avoid circular imports
-    from myagent.agent.factory import create_toolcall_agent
-    from myagent.llm import LLM
-    
-    # Get Deep Agent tools
-    deep_middleware = DeepAgentMiddleware()
-    deep_tools = deep_middleware.get_tools()
-    
-    # Combine with additional tools
-    all_tools = deep_tools + (tools or [])
+    from myagent.agent.factory import create_deep_agent as _create_deep_agent
     
-    # Create LLM instance (LLM uses config_name, not keyword arguments)
-    llm = LLM(config_name=name.lower())
-    
-    # Create base agent using create_toolcall_agent directly
-    agent = create_toolcall_agent(
+    return _create_deep_agent(
+        tools=tools,
+        llm_config=llm_config,
         name=name,
-        llm=llm,
-        tools=all_tools
+        description=description,
     )
-    
-    # Set description
-    agent.description = description
-    
-    # Build enhanced system prompt
-    context = MiddlewareContext(
-        agent=agent,
-        tools=all_tools,
-        system_prompt_parts=[],
-        metadata={}
-    )
-    
-    enhanced_prompt = deep_middleware.get_system_prompt_addition(context)
-    if agent.system_prompt:
-        agent.system_prompt = f"{agent.system_prompt}\n\n{enhanced_prompt}"
-    else:
-        agent.system_prompt = enhanced_prompt
-    
-    return agent
\ No newline at end of file
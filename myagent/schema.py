@@ -1,9 +1,11 @@
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 from typing import Literal
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 
 class Role(str, Enum):
@@ -18,6 +20,11 @@ class Role(str, Enum):
 ROLE_VALUES = tuple(role.value for role in Role)
 ROLE_TYPE = Literal[ROLE_VALUES]  # type: ignore
 
+# Plain-string role values for comparisons inside Memory's per-message loops
+_ROLE_USER = Role.USER.value
+_ROLE_ASSISTANT = Role.ASSISTANT.value
+_ROLE_TOOL = Role.TOOL.value
+
 
 class ToolChoice(str, Enum):
     """Tool choice options"""
@@ -53,6 +60,15 @@ class ToolCall(BaseModel):
     function: Function
 
 
+def _copy_payload(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-shaped payload; leaves are shared."""
+    if type(value) is dict:
+        return {k: _copy_payload(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_payload(v) for v in value]
+    return value
+
+
 class Message(BaseModel):
     """Represents a chat message in the conversation"""
 
@@ -63,6 +79,45 @@ class Message(BaseModel):
     tool_call_id: str | None = Field(default=None)
     base64_image: str | None = Field(default=None)
 
+    # Cached dict forms, dropped on field assignment: key None holds to_dict()
+    # for Memory.to_dict_list, bool keys hold LLM.format_messages payloads
+    _dicts: dict[bool | None, dict | None] | None = PrivateAttr(default=None)
+    # tool_calls contents the cache was built from; catches in-place edits
+    # (e.g. of a call's arguments) that __setattr__ does not see
+    _dicts_stamp: tuple | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._dicts = None
+
+    def _cached_dict(
+        self, key: bool | None, build: Callable[[], dict | None]
+    ) -> dict | None:
+        """Return a copy of the dict form cached under ``key``, building it once.
+
+        Copies are independent of the cache down to nested lists and dicts,
+        so callers may modify them freely.
+        """
+        calls = self.tool_calls
+        stamp = (
+            tuple(
+                (call.id, call.type, call.function.name, call.function.arguments)
+                for call in calls
+            )
+            if calls
+            else None
+        )
+        cache = self._dicts
+        if cache is None or stamp != self._dicts_stamp:
+            cache = self._dicts = {}
+            self._dicts_stamp = stamp
+        if key in cache:
+            data = cache[key]
+        else:
+            data = cache[key] = build()
+        return None if data is None else _copy_payload(data)
+
     def __add__(self, other) -> list["Message"]:
         """支持 Message + list 或 Message + Message 的操作"""
         if isinstance(other, list):
@@ -89,7 +144,9 @@ class Message(BaseModel):
         if self.content is not None:
             message["content"] = self.content
         if self.tool_calls is not None:
-            message["tool_calls"] = [tool_call.dict() for tool_call in self.tool_calls]
+            message["tool_calls"] = [
+                tool_call.model_dump() for tool_call in self.tool_calls
+            ]
         if self.name is not None:
             message["name"] = self.name
         if self.tool_call_id is not None:
@@ -162,31 +219,133 @@ class Memory(BaseModel):
     messages: list[Message] = Field(default_factory=list)
     max_messages: int = Field(default=100)
 
+    # Index of the latest message per role and of the latest assistant
+    # message with content, maintained by add_message(s); valid only while
+    # the list, its length and its last message are unchanged.
+    _last_idx: dict[str, int] = PrivateAttr(default_factory=dict)
+    _last_assistant_idx: int | None = PrivateAttr(default=None)
+    _tracked_shape: tuple[int, int, Message | None] | None = PrivateAttr(default=None)
+
+    def _shape(self) -> tuple[int, int, Message | None]:
+        messages = self.messages
+        return (id(messages), len(messages), messages[-1] if messages else None)
+
+    def _is_tracked(self) -> bool:
+        shape = self._tracked_shape
+        if shape is None:
+            return False
+        messages = self.messages
+        # The last message is compared by identity: an in-place replacement
+        # (e.g. messages[:] = ...) keeps the list and often its length.
+        # Replacing only earlier items in place is not detected.
+        return (
+            shape[0] == id(messages)
+            and shape[1] == len(messages)
+            and shape[2] is (messages[-1] if messages else None)
+        )
+
+    def _index_from(self, start: int) -> None:
+        """Record messages from ``start`` onward in the per-role indexes."""
+        last_idx = self._last_idx
+        for i in range(start, len(self.messages)):
+            msg = self.messages[i]
+            last_idx[msg.role] = i
+            if msg.role == _ROLE_ASSISTANT and msg.content:
+                self._last_assistant_idx = i
+
+    def _reindex(self) -> None:
+        """Rebuild the indexes after messages were modified directly."""
+        self._last_idx = {}
+        self._last_assistant_idx = None
+        self._index_from(0)
+        self._tracked_shape = self._shape()
+
+    def _track_appended(self, start: int, was_tracked: bool) -> None:
+        """Update the indexes for messages appended from ``start``."""
+        if was_tracked:
+            self._index_from(start)
+        # Optional: Implement message limit
+        overflow = len(self.messages) - self.max_messages
+        if overflow > 0:
+            self.messages = self.messages[-self.max_messages :]
+            self._last_idx = {
+                role: i - overflow
+                for role, i in self._last_idx.items()
+                if i >= overflow
+            }
+            if self._last_assistant_idx is not None:
+                idx = self._last_assistant_idx - overflow
+                self._last_assistant_idx = idx if idx >= 0 else None
+        self._tracked_shape = self._shape() if was_tracked else None
+
     def add_message(self, message: Message) -> None:
         """Add a message to memory"""
+        was_tracked = self._is_tracked()
         self.messages.append(message)
-        # Optional: Implement message limit
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
+        self._track_appended(len(self.messages) - 1, was_tracked)
 
     def add_messages(self, messages: list[Message]) -> None:
         """Add multiple messages to memory"""
+        was_tracked = self._is_tracked()
+        start = len(self.messages)
         self.messages.extend(messages)
-        # Optional: Implement message limit
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages :]
+        self._track_appended(start, was_tracked)
 
     def clear(self) -> None:
         """Clear all messages"""
         self.messages.clear()
+        self._last_idx = {}
+        self._last_assistant_idx = None
+        self._tracked_shape = self._shape()
+
+    def last_message(self, role: str) -> Message | None:
+        """Return the most recent message with the given role.
+
+        Uses the index maintained by add_message(s); rebuilds it when
+        messages were modified directly.
+        """
+        if self._is_tracked():
+            idx = self._last_idx.get(role)
+            if idx is None:
+                return None
+            msg = self.messages[idx]
+            if msg.role == role:
+                return msg
+
+        self._reindex()
+        idx = self._last_idx.get(role)
+        return None if idx is None else self.messages[idx]
+
+    def last_assistant_content(self) -> str | None:
+        """Return the content of the most recent assistant message.
+
+        Uses the index maintained by add_message(s); rebuilds it when
+        messages were modified directly.
+        """
+        if self._is_tracked():
+            idx = self._last_assistant_idx
+            if idx is None:
+                return None
+            msg = self.messages[idx]
+            if msg.role == _ROLE_ASSISTANT and msg.content:
+                return msg.content
+
+        self._reindex()
+        idx = self._last_assistant_idx
+        return None if idx is None else self.messages[idx].content
 
     def get_recent_messages(self, n: int) -> list[Message]:
         """Get n most recent messages"""
         return self.messages[-n:]
 
     def to_dict_list(self) -> list[dict]:
-        """Convert messages to list of dicts"""
-        return [msg.to_dict() for msg in self.messages]
+        """Convert messages to list of dicts
+
+        Each message's dict is built once and reused until the message
+        changes, so repeated snapshots only convert new messages. The
+        returned dicts are copies and may be modified.
+        """
+        return [msg._cached_dict(None, msg.to_dict) for msg in self.messages]
 
     def clean_incomplete_tool_calls(self) -> None:
         """Clean incomplete tool_calls messages to fix OpenAI API compatibility.
@@ -200,47 +359,42 @@ class Memory(BaseModel):
         if not self.messages:
             return
 
-        # First pass: identify all valid tool_call_ids that have complete chains
+        # First pass: identify all valid tool_call_ids that have complete
+        # chains. A chain is an assistant message with tool_calls plus the tool
+        # responses before the next assistant or user message, so a single
+        # forward sweep tracking the open chain finds them all.
         valid_tool_call_ids = set()
+        open_ids: set | None = None
+        found_responses: set = set()
 
-        for i, msg in enumerate(self.messages):
-            if (
-                msg.role == Role.ASSISTANT.value
-                and msg.tool_calls is not None
-                and len(msg.tool_calls) > 0
-            ):
-                tool_call_ids = {tc.id for tc in msg.tool_calls}
-                found_responses = set()
-
-                # Check subsequent messages for tool responses
-                j = i + 1
-                while j < len(self.messages):
-                    next_msg = self.messages[j]
-
-                    if (
-                        next_msg.role == Role.TOOL.value
-                        and next_msg.tool_call_id in tool_call_ids
-                    ):
-                        found_responses.add(next_msg.tool_call_id)
-                    elif next_msg.role in [Role.ASSISTANT.value, Role.USER.value]:
-                        break
-                    j += 1
-
-                # If all tool calls have responses, mark them as valid
-                if found_responses == tool_call_ids:
-                    valid_tool_call_ids.update(tool_call_ids)
+        for msg in self.messages:
+            role = msg.role
+            if role == _ROLE_TOOL:
+                if open_ids is not None and msg.tool_call_id in open_ids:
+                    found_responses.add(msg.tool_call_id)
+            elif role in (_ROLE_ASSISTANT, _ROLE_USER):
+                # If all tool calls of the open chain have responses, mark them as valid
+                if open_ids is not None and found_responses == open_ids:
+                    valid_tool_call_ids.update(open_ids)
+                open_ids = None
+                if role == _ROLE_ASSISTANT and msg.tool_calls:
+                    open_ids = {tc.id for tc in msg.tool_calls}
+                    found_responses = set()
+
+        if open_ids is not None and found_responses == open_ids:
+            valid_tool_call_ids.update(open_ids)
 
         # Second pass: keep only messages that are valid
         cleaned_messages = []
 
         for msg in self.messages:
-            if msg.role == Role.TOOL.value:
+            if msg.role == _ROLE_TOOL:
                 # Keep tool messages only if they respond to valid tool calls
                 if msg.tool_call_id in valid_tool_call_ids:
                     cleaned_messages.append(msg)
                 # Otherwise skip orphaned tool messages
             elif (
-                msg.role == Role.ASSISTANT.value
+                msg.role == _ROLE_ASSISTANT
                 and msg.tool_calls is not None
                 and len(msg.tool_calls) > 0
             ):
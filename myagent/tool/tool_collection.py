@@ -19,12 +19,23 @@ class ToolCollection:
     def __init__(self, *tools: BaseTool):
         self.tools = tools
         self.tool_map = {tool.name: tool for tool in tools}
+        # Cached to_params() output and the tools tuple it was built from
+        self._params: list[dict[str, Any]] = []
+        self._params_tools: tuple[BaseTool, ...] | None = None
 
     def __iter__(self):
         return iter(self.tools)
 
     def to_params(self) -> list[dict[str, Any]]:
-        return [tool.to_param() for tool in self.tools]
+        """Return function-call schemas for all tools.
+
+        The list is built once and reused across agent steps until the tool
+        set changes; callers must treat it as read-only.
+        """
+        if self._params_tools is not self.tools:
+            self._params = [tool.to_param() for tool in self.tools]
+            self._params_tools = self.tools
+        return self._params
 
     async def execute(
         self, *, name: str, tool_input: dict[str, Any] | None = None
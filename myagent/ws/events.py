@@ -105,6 +105,7 @@ class PlanEvents:
 
     Usage patterns:
     - START: content = {question}, metadata = plan context
+    - CACHE_HIT: content = {question, task_count}; planning was skipped
     - COMPLETED: content = {tasks list}, metadata = {task_count, plan_summary, stats}
     - CANCELLED: metadata = {reason}
     - STEP_COMPLETED: metadata = {step_name, step_index}
@@ -115,6 +116,7 @@ class PlanEvents:
     COMPLETED = "plan.completed"
     CANCELLED = "plan.cancelled"
     COERCION_ERROR = "plan.coercion_error"
+    CACHE_HIT = "plan.cache_hit"                # 命中规划缓存时跳过规划
     STEP_COMPLETED = "plan.step_completed"      # 规划步骤完成
     VALIDATION_ERROR = "plan.validation_error"  # 规划验证错误
 
@@ -152,6 +154,7 @@ class PipelineEvents:
     """Pipeline-level events."""
 
     COMPLETED = "pipeline.completed"
+    BATCH = "pipeline.batch"  # content = {events: [event, ...]} when event batching is enabled
 
 
 class AgentEvents:
@@ -9,12 +9,11 @@ add backpressure policies later (queue limits, coalescing, etc.).
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
 from websockets.server import WebSocketServerProtocol
 
-from .utils import is_websocket_closed
+from .utils import encode_event, is_websocket_closed
 from myagent.logger import logger
 
 
@@ -29,8 +28,11 @@ class OutboundChannel:
         coalesce_window_ms: int = 75,
         coalesce_events: set[str] | None = None,
         name: str | None = None,
+        binary: bool = False,
     ) -> None:
         self.websocket = websocket
+        # Send events as binary frames of UTF-8 JSON instead of text frames
+        self.binary = binary
         self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
         self._writer_task: asyncio.Task | None = None
         self._closed = False
@@ -104,7 +106,7 @@ class OutboundChannel:
                     if is_websocket_closed(self.websocket):
                         logger.debug("WebSocket closed; dropping outbound event")
                     else:
-                        await self.websocket.send(json.dumps(event))
+                        await self.websocket.send(encode_event(event, binary=self.binary))
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
@@ -10,15 +10,20 @@ create_plan_solver().
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
-from dataclasses import asdict, dataclass, is_dataclass
-from typing import Any, Awaitable, Callable, Sequence
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass, replace
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Sequence
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from myagent.logger import logger
 from myagent.schema import AgentState
 from myagent.ws import get_ws_session_context, send_websocket_message
+from myagent.ws.utils import dumps_event
 from myagent.ws.events import (
     create_event,
     AgentEvents,
@@ -32,23 +37,26 @@ from myagent.stats import get_stats_manager
 
 AggregateFn = Callable[["PlanContext", Sequence["SolverRunResult"]], Any]
 AsyncAggregateFn = Callable[["PlanContext", Sequence["SolverRunResult"]], Awaitable[Any]]
+AsyncStreamAggregateFn = Callable[
+    ["PlanContext", AsyncIterator["SolverRunResult"]], Awaitable[Any]
+]
 ProgressCallback = Callable[[str, dict[str, Any]], Awaitable[None] | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanContext:
     """Context shared from planning to solving and aggregation stages."""
 
     name: str
     question: str
-    tasks: Sequence[Any]
+    tasks: tuple[Any, ...]
     plan_summary: str | None
     raw_plan_output: str | None
     # List of per-call statistics (each item is one LLM call record)
     plan_statistics: list[dict[str, Any]] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolverRunResult:
     """Represents the outcome of a single solver agent run."""
 
@@ -61,7 +69,7 @@ class SolverRunResult:
     statistics: list[dict[str, Any]] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanSolveResult:
     """Aggregate outcome of the plan → solve pipeline."""
 
@@ -74,7 +82,7 @@ class PlanSolveResult:
     metrics: dict[str, Any] | None = None
 
     @property
-    def tasks(self) -> Sequence[Any]:
+    def tasks(self) -> tuple[Any, ...]:
         return self.context.tasks
 
     @property
@@ -94,6 +102,61 @@ class PlanSolveResult:
         return self.statistics
 
 
+@dataclass(frozen=True, slots=True)
+class CachedPlan:
+    """Planner output kept by PlanCache for reuse on repeated questions."""
+
+    tasks: tuple[Any, ...]
+    plan_summary: str | None
+    raw_plan_output: str | None
+
+
+class PlanCache:
+    """In-memory LRU cache of planner output keyed by request fingerprint.
+
+    Keys are SHA-256 digests of the normalized (stripped, lower-cased)
+    planner request, so only exact repeats hit. With ``ttl`` set, entries
+    older than that many seconds are dropped on lookup. Subclasses can
+    override ``key_for``/``get``/``put`` to add fuzzier matching or shared
+    storage.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: float | None = None) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds when provided.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Entry and the monotonic time it was stored
+        self._entries: OrderedDict[str, tuple[CachedPlan, float]] = OrderedDict()
+
+    def key_for(self, question: str, *, namespace: str = "") -> str:
+        """Fingerprint a request; namespace separates different planners."""
+        normalized = question.strip().lower()
+        return hashlib.sha256(f"{namespace}\0{normalized}".encode()).hexdigest()
+
+    def get(self, key: str) -> CachedPlan | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        entry, stored_at = item
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedPlan) -> None:
+        self._entries[key] = (entry, time.monotonic() if self.ttl is not None else 0.0)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class PlanAgent:
     """Base class for plan agents used in the plan→solve pipeline.
 
@@ -120,8 +183,9 @@ class PlanAgent:
 
     def extract_summary(self, agent: BaseAgent, plan_output: str) -> str | None:
         """Return a human-readable summary of the plan."""
-        if getattr(agent, "final_response", None):
-            return agent.final_response  # type: ignore[attr-defined]
+        final_response = getattr(agent, "final_response", None)
+        if final_response:
+            return final_response
         return plan_output
 
     # -- Optional hook -------------------------------------------------
@@ -134,16 +198,36 @@ class PlanAgent:
         """
         return tasks
 
+    def dependencies_of(self, task: Any) -> Sequence[Any]:
+        """Return the ids of tasks that must complete before ``task`` runs.
+
+        Default implementation reads a ``dependencies`` attribute or dict
+        key. Ids are matched against the other tasks' ``id``; tasks without
+        dependencies all start immediately.
+        """
+        deps = getattr(task, "dependencies", None)
+        if deps is None and isinstance(task, dict):
+            deps = task.get("dependencies")
+        return deps or ()
+
 
 class SolverAgent:
     """Base class for solver agents that execute individual plan tasks."""
 
     def __init__(self, name: str | None = None) -> None:
         self.name = name or self.__class__.__name__.lower()
+        # (context, prefix) of the last build_shared_prefix call
+        self._shared_prefix: tuple[PlanContext, str] | None = None
 
     # -- Required hooks -------------------------------------------------
-    def build_agent(self, task: Any, *, context: PlanContext) -> BaseAgent:
-        """Instantiate an agent configured for the given task."""
+    def build_agent(
+        self, task: Any, *, context: PlanContext, shared: Any = None
+    ) -> BaseAgent:
+        """Instantiate an agent configured for the given task.
+
+        Overrides may omit ``shared``; when accepted, it receives the value
+        returned by ``build_shared_resources`` for this run.
+        """
         raise NotImplementedError("SolverAgent.build_agent must be implemented.")
 
     def extract_result(
@@ -156,17 +240,138 @@ class SolverAgent:
     def build_request(
         self, task: Any, *, context: PlanContext
     ) -> str:
-        """Construct the request message for the solver agent."""
+        """Construct the request message for the solver agent.
+
+        Defaults to the shared prefix (when non-empty) followed by the task
+        suffix, so every request of a run starts with identical text that
+        providers with prompt caching only encode once.
+        """
+        cached = getattr(self, "_shared_prefix", None)
+        if cached is None or cached[0] is not context:
+            # Built once per context rather than once per task
+            cached = self._shared_prefix = (context, self.build_shared_prefix(context))
+        suffix = self.build_task_suffix(task, context=context)
+        return f"{cached[1]}\n{suffix}" if cached[1] else suffix
+
+    def build_shared_prefix(self, context: PlanContext) -> str:
+        """Return request text common to every task (e.g. question, plan summary)."""
+        return ""
+
+    def build_task_suffix(self, task: Any, *, context: PlanContext) -> str:
+        """Return the task-specific part of the default request."""
         return str(task)
 
     def extract_summary(
         self, agent: BaseAgent, solver_output: str, task: Any, *, context: PlanContext
     ) -> str | None:
         """Return a concise summary of the solver outcome."""
-        if getattr(agent, "final_response", None):
-            return agent.final_response  # type: ignore[attr-defined]
+        final_response = getattr(agent, "final_response", None)
+        if final_response:
+            return final_response
         return solver_output
 
+    async def warmup(self) -> None:
+        """Prepare shared solver resources before any task is known.
+
+        Runs concurrently with planning, so slow setup (clients, tool
+        registries, caches) is off the critical path. Default does nothing.
+        """
+
+    def agent_pool_key(self, task: Any, *, context: PlanContext) -> Hashable | None:
+        """Return a key under which built agents may be reused, or None.
+
+        Only consulted with ``reuse_solver_agents``: tasks returning the same
+        key run copies of one agent built for the first of them, so the key
+        must cover everything ``build_agent`` reads from ``task`` and
+        ``context`` (prompt, tools, memory). Default None builds a fresh
+        agent per task.
+        """
+        return None
+
+    def build_shared_resources(self, context: PlanContext) -> Any:
+        """Build resources reused by every agent of a run (clients, schemas).
+
+        Called once per solve before any agent is built; the result is
+        passed to ``build_agent`` as ``shared``. Default returns None.
+        """
+        return None
+
+    async def run_batch(
+        self, tasks: Sequence[Any], *, context: PlanContext
+    ) -> Sequence[SolverRunResult]:
+        """Solve all tasks in one call, returning results in input order.
+
+        Optional: when overridden, the pipeline calls this instead of running
+        an agent per task, so implementations can submit a provider batch
+        request and send shared context once. Only used for plans without
+        task dependencies; per-task cancel/restart does not apply.
+        """
+        raise NotImplementedError("SolverAgent.run_batch is optional.")
+
+
+# Agent classes found without get_statistics; the failed lookup (an
+# AttributeError raised through pydantic's __getattr__) is paid once per class
+_NO_STATISTICS: set[type] = set()
+
+
+def _statistics_getter(agent: Any) -> Callable[[], Any] | None:
+    """Return the agent's get_statistics method, if its class provides one."""
+    cls = type(agent)
+    if cls in _NO_STATISTICS:
+        return None
+    getter = getattr(agent, "get_statistics", None)
+    if getter is None:
+        _NO_STATISTICS.add(cls)
+    return getter
+
+
+def _stats_model(stats_obj: Any, agent: Any) -> Any:
+    """Model named in get_statistics() output, else the agent's LLM model."""
+    model = stats_obj.get("model") if isinstance(stats_obj, dict) else None
+    return model or getattr(getattr(agent, "llm", None), "model", None)
+
+
+def _solver_completed_payload(result: SolverRunResult, model: Any) -> dict[str, Any]:
+    """Build the solver.completed payload for one result."""
+    sanitized_result = {
+        "output": result.output,
+        "summary": result.summary,
+        "agent_name": result.agent_name,
+    }
+    # Attach model used by the solver agent for easier client display
+    if model:
+        sanitized_result["model"] = model
+    if result.statistics is not None:
+        # statistics is a List[Dict] (per-call records)
+        sanitized_result["statistics"] = result.statistics
+    return {"task": result.task, "result": sanitized_result}
+
+
+def _shape_call_records(
+    stats_obj: Any, origin: str, agent_name: str, model: Any
+) -> list[dict[str, Any]]:
+    """Copy per-call records out of get_statistics() output for attribution.
+
+    Prefers the ``calls`` list and falls back to wrapping the object. Each
+    record is copied with origin/agent defaults in one dict display, and a
+    missing model is filled in for UI display.
+    """
+    if not isinstance(stats_obj, dict):
+        return []
+    maybe_calls = stats_obj.get("calls")
+    calls = (
+        [c for c in maybe_calls if isinstance(c, dict)]
+        if isinstance(maybe_calls, list)
+        else []
+    )
+    shaped = []
+    for call in calls or (stats_obj,):
+        entry = {"origin": origin, "agent": agent_name, **call}
+        if model and not entry.get("model"):
+            entry["model"] = model
+        shaped.append(entry)
+    return shaped
+
 
 class PlanSolverPipeline:
     """Coordinates a planning agent with multiple solver agents."""
@@ -177,22 +382,60 @@ class PlanSolverPipeline:
         name: str = "plan_solver",
         planner: PlanAgent,
         solver: SolverAgent,
-        aggregator: AggregateFn | AsyncAggregateFn | None = None,
+        aggregator: AggregateFn | AsyncAggregateFn | AsyncStreamAggregateFn | None = None,
+        stream_aggregator: bool = False,
         concurrency: int | None = None,
         progress_callback: ProgressCallback | None = None,
+        plan_cache: PlanCache | None = None,
+        reuse_plan_agent: bool = False,
+        reuse_solver_agents: bool = False,
+        max_pooled_agents: int = 8,
+        fail_fast: bool = False,
+        record_failures: bool = False,
+        capture_calls: bool = True,
+        task_control: bool = True,
+        background_notify: bool = False,
+        dedupe_requests: bool = False,
     ) -> None:
         self.name = name
         self.planner = planner
         self.solver = solver
         self.aggregator = aggregator
+        self.stream_aggregator = stream_aggregator
         self.concurrency = concurrency
         self.progress_callback = progress_callback
+        self.plan_cache = plan_cache
+        self.reuse_plan_agent = reuse_plan_agent
+        self.reuse_solver_agents = reuse_solver_agents
+        self.max_pooled_agents = max_pooled_agents
+        self.fail_fast = fail_fast
+        self.record_failures = record_failures
+        self.capture_calls = capture_calls
+        self.task_control = task_control
+        self.background_notify = background_notify
+        self.dedupe_requests = dedupe_requests
+        # Background delivery of progress events (see _notify)
+        self._notify_queue: asyncio.Queue[tuple[Any, ...] | None] | None = None
+        self._notify_task: asyncio.Task | None = None
+        # Template agents by pool key, cloned per run (see _acquire_agent)
+        self._agent_pool: OrderedDict[tuple[Hashable, ...], BaseAgent] = OrderedDict()
         # Runtime management for per-task control
         self._active_solver_tasks: dict[str, asyncio.Task] = {}
         self._task_key_map: dict[str, Any] = {}
         self._cancel_requests: set[str] = set()
         self._restart_requests: set[str] = set()
-        self._results_map: dict[str, SolverRunResult] = {}
+        self._task_index_map: dict[str, int] = {}
+        self._queued_keys: set[str] = set()
+        self._waiting_keys: set[str] = set()
+        # Solver warmup started alongside the first planning run
+        self._solver_warmup: asyncio.Task | None = None
+        self._solver_warmup_settled = False
+        # Per-call statistics of the last _run_solvers, by task index
+        self._solver_statistics: dict[int, list[dict[str, Any]]] = {}
+        # Enqueues (index, key) into the running _run_solvers, if any
+        self._enqueue_solver: Callable[[int, str], None] | None = None
+        # Guards the cancel/restart API; _run_solvers' own bookkeeping has
+        # no await inside and is already serialized by the event loop
         self._lock = asyncio.Lock()
 
     async def run(self, question: str) -> PlanSolveResult:
@@ -204,13 +447,84 @@ class PlanSolverPipeline:
         return await self.solve_and_aggregate(context)
 
     async def plan(self, question: str) -> PlanContext:
-        """Run planning stage and emit plan events, returning a PlanContext."""
-        await self._notify(PlanEvents.START, {"question": question})
+        """Run planning stage and emit plan events, returning a PlanContext.
+
+        With a plan cache configured, a question whose planner request was
+        planned before reuses the cached tasks and skips the planning agent
+        entirely; a ``plan.cache_hit`` event precedes ``plan.completed``.
+        """
+        await self._notify(PlanEvents.START, lambda: {"question": question})
+        # Overlaps the solver warmup with planning
+        self._start_solver_warmup()
+
+        plan_request: str | None = None
+        cache_key: str | None = None
+        cached: CachedPlan | None = None
+        if self.plan_cache is not None:
+            # Planner class and name keep differently prompted planners apart
+            plan_request = self.planner.build_request(question)
+            cache_key = self.plan_cache.key_for(
+                plan_request,
+                namespace=f"{type(self.planner).__qualname__}|{self.planner.name}",
+            )
+            cached = self.plan_cache.get(cache_key)
 
-        plan_agent = self.planner.build_agent()
-        plan_request = self.planner.build_request(question)
+        if cached is not None:
+            logger.debug("plan_cache hit for planner {}", self.planner.name)
+            await self._notify(
+                PlanEvents.CACHE_HIT,
+                lambda: {"question": question, "task_count": len(cached.tasks)},
+            )
+            context = PlanContext(
+                name=self.name,
+                question=question,
+                tasks=cached.tasks,
+                plan_summary=cached.plan_summary,
+                raw_plan_output=cached.raw_plan_output,
+            )
+        else:
+            context = await self._run_planner(question, plan_request)
+            if self.plan_cache is not None and cache_key is not None:
+                self.plan_cache.put(
+                    cache_key,
+                    CachedPlan(
+                        tasks=tuple(context.tasks),
+                        plan_summary=context.plan_summary,
+                        raw_plan_output=context.raw_plan_output,
+                    ),
+                )
+        await self._notify(PlanEvents.COMPLETED, lambda: self._plan_completed_payload(context))
+        await self._flush_notifications()
+        return context
+
+    def _plan_completed_payload(self, context: PlanContext) -> dict[str, Any]:
+        plan_statistics = context.plan_statistics
+        # Best-effort global metrics snapshot after planning phase
+        metrics_snapshot = None
+        try:
+            metrics_snapshot = get_stats_manager().snapshot()
+        except Exception:
+            metrics_snapshot = None
+        return {
+            "tasks": context.tasks,
+            "plan_summary": context.plan_summary,
+            # statistics is a List[Dict] (per-call records); may be omitted if None
+            **({"statistics": plan_statistics} if plan_statistics is not None else {}),
+            **({"metrics": metrics_snapshot} if metrics_snapshot is not None else {}),
+        }
+
+    async def _run_planner(
+        self, question: str, plan_request: str | None = None
+    ) -> PlanContext:
+        """Run the planning agent and build a PlanContext from its output."""
+        if self.reuse_plan_agent:
+            plan_agent = self._acquire_agent(("plan", self.planner.name), self.planner.build_agent)
+        else:
+            plan_agent = self.planner.build_agent()
+        if plan_request is None:
+            plan_request = self.planner.build_request(question)
         plan_output = await plan_agent.run(plan_request)
-        tasks = list(self.planner.extract_tasks(plan_agent, plan_output))
+        tasks = tuple(self.planner.extract_tasks(plan_agent, plan_output))
 
         if not tasks:
             raise RuntimeError(
@@ -219,36 +533,17 @@ class PlanSolverPipeline:
 
         plan_summary = self.planner.extract_summary(plan_agent, plan_output)
         plan_statistics: list[dict[str, Any]] | None = None
-        if hasattr(plan_agent, "get_statistics"):
+        get_statistics = _statistics_getter(plan_agent)
+        if get_statistics is not None:
             try:
-                stats_obj = plan_agent.get_statistics()
-                # Prefer per-call records; fall back to wrapping the object
-                calls = []
-                if isinstance(stats_obj, dict):
-                    maybe_calls = stats_obj.get("calls")
-                    if isinstance(maybe_calls, list):
-                        calls = [c.copy() for c in maybe_calls if isinstance(c, dict)]
-                if not calls and isinstance(stats_obj, dict):
-                    calls = [stats_obj]
-
-                # Annotate origin/agent for easier downstream attribution
-                agent_name = getattr(plan_agent, "name", self.planner.name)
-                stats_model = None
-                try:
-                    if isinstance(stats_obj, dict):
-                        stats_model = stats_obj.get("model")
-                except Exception:
-                    stats_model = None
-                if not stats_model:
-                    # Fallback to the agent's configured LLM model
-                    stats_model = getattr(getattr(plan_agent, "llm", None), "model", None)
-                for c in calls:
-                    c.setdefault("origin", "plan")
-                    c.setdefault("agent", agent_name)
-                    # Ensure model name is present for UI display
-                    if isinstance(c, dict) and not c.get("model"):
-                        if stats_model:
-                            c["model"] = stats_model
+                stats_obj = get_statistics()
+                stats_model = _stats_model(stats_obj, plan_agent)
+                calls = _shape_call_records(
+                    stats_obj,
+                    "plan",
+                    getattr(plan_agent, "name", self.planner.name),
+                    stats_model,
+                )
                 plan_statistics = calls or None
             except Exception as exc:  # pragma: no cover - safeguard
                 logger.debug(
@@ -256,7 +551,7 @@ class PlanSolverPipeline:
                     getattr(plan_agent, "name", self.planner.name),
                     exc,
                 )
-        context = PlanContext(
+        return PlanContext(
             name=self.name,
             question=question,
             tasks=tasks,
@@ -265,34 +560,36 @@ class PlanSolverPipeline:
             plan_statistics=plan_statistics,
         )
 
-        # Best-effort global metrics snapshot after planning phase
-        metrics_snapshot = None
-        try:
-            metrics_snapshot = get_stats_manager().snapshot()
-        except Exception:
-            metrics_snapshot = None
-
-        await self._notify(
-            PlanEvents.COMPLETED,
-            {
-                "tasks": tasks,
-                "plan_summary": plan_summary,
-                # statistics is a List[Dict] (per-call records); may be omitted if None
-                **({"statistics": plan_statistics} if plan_statistics is not None else {}),
-                **({"metrics": metrics_snapshot} if metrics_snapshot is not None else {}),
-            },
-        )
-
-        return context
-
     async def solve_and_aggregate(self, context: PlanContext) -> PlanSolveResult:
         """Execute solver stage for the given context and aggregate results."""
-        tasks = list(context.tasks)
-        solver_results = await self._run_solvers(tasks, context)
-        aggregate_output = await self._run_aggregator(context, solver_results)
-        pipeline_statistics = self._build_pipeline_statistics(
-            context.plan_statistics, solver_results
-        )
+        tasks = context.tasks
+        if self.aggregator and self.stream_aggregator:
+            # Aggregate concurrently, feeding results in completion order
+            stream: asyncio.Queue[SolverRunResult | None] = asyncio.Queue()
+            aggregate_task = asyncio.create_task(
+                self._run_stream_aggregator(context, stream)
+            )
+            try:
+                solver_results = await self._run_solvers(
+                    tasks, context, on_result=stream.put_nowait
+                )
+            except BaseException:
+                aggregate_task.cancel()
+                raise
+            stream.put_nowait(None)
+            aggregate_output = await aggregate_task
+        else:
+            solver_results = await self._run_solvers(tasks, context)
+            aggregate_output = await self._run_aggregator(context, solver_results)
+        call_count: int | None = None
+        if self.capture_calls:
+            pipeline_statistics = self._build_pipeline_statistics(context.plan_statistics)
+        else:
+            # Count the calls instead of building the combined per-call list
+            pipeline_statistics = None
+            call_count = len(context.plan_statistics or ()) + sum(
+                map(len, self._solver_statistics.values())
+            )
         # Best-effort global metrics snapshot for the entire pipeline
         metrics_snapshot = None
         try:
@@ -302,15 +599,17 @@ class PlanSolverPipeline:
 
         await self._notify(
             PipelineEvents.COMPLETED,
-            {
+            lambda: {
                 "context": context,
                 "solver_results": solver_results,
                 "aggregate_output": aggregate_output,
                 **({"statistics": pipeline_statistics} if pipeline_statistics is not None else {}),
+                **({"call_count": call_count} if call_count is not None else {}),
                 **({"metrics": metrics_snapshot} if metrics_snapshot is not None else {}),
             },
         )
 
+        await self._flush_notifications()
         return PlanSolveResult(
             context=context,
             solver_results=solver_results,
@@ -320,209 +619,477 @@ class PlanSolverPipeline:
         )
 
     async def _run_solvers(
-        self, tasks: Sequence[Any], context: PlanContext
+        self,
+        tasks: Sequence[Any],
+        context: PlanContext,
+        *,
+        on_result: Callable[[SolverRunResult], Any] | None = None,
     ) -> list[SolverRunResult]:
         """Run solvers with per-task cancel/restart support.
 
-        This implementation launches a task per slide and then waits
-        dynamically for completions, while allowing external cancellation
-        and restart requests to affect individual tasks without impacting
-        others.
+        Tasks are fed through a queue to at most ``concurrency`` long-lived
+        workers (one per task when unlimited), started only while queued
+        tasks outnumber idle workers, so only running tasks hold a
+        coroutine. Each running task is still its own asyncio.Task, which
+        lets external cancellation and restart requests affect individual
+        tasks without impacting others. Results keep the input order.
+
+        Tasks declaring dependencies via ``PlanAgent.dependencies_of`` are
+        queued only once all their prerequisites have completed. Tasks left
+        waiting at the end (a prerequisite failed or was cancelled, or the
+        dependencies form a cycle) are not run; each gets a
+        ``solver.cancelled`` event with ``reason: "blocked"``.
+        ``on_result`` is called with each successful result as it completes.
+
+        With ``task_control`` off, solvers run inline in their workers and the
+        cancel/restart requests are refused.
+
+        Every solver failure emits ``solver.step_failed`` for its task. With
+        ``fail_fast`` the first one cancels every other task (or, without
+        ``task_control``, lets running ones finish) and is re-raised.
+        Otherwise the failed task is left out of the results (or, with
+        ``record_failures``, returned with ``output=None`` and an
+        ``error: ...`` summary), and tasks that depend on it are not run.
+
+        With ``dedupe_requests``, tasks whose solver requests are identical
+        share one solve within the run; restarted tasks always solve again.
+
+        Solvers overriding ``SolverAgent.run_batch`` get every task in one
+        call instead, as long as no task declares dependencies.
         """
-        semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency else None
-
-        async def _execute(task: Any) -> SolverRunResult:
-
-            async def _run() -> SolverRunResult:
-                # Emit start only when the task actually acquires a slot
-                await self._notify(SolverEvents.START, {"task": task})
-                agent = self.solver.build_agent(task, context=context)
-                request = self.solver.build_request(task, context=context)
-                solver_output = await agent.run(request)
-                output = self.solver.extract_result(
-                    agent, solver_output, task, context=context
-                )
-                summary = self.solver.extract_summary(
-                    agent, solver_output, task, context=context
-                )
-                statistics: list[dict[str, Any]] | None = None
-                if hasattr(agent, "get_statistics"):
-                    try:
-                        stats_obj = agent.get_statistics()
-                        calls = []
-                        if isinstance(stats_obj, dict):
-                            maybe_calls = stats_obj.get("calls")
-                            if isinstance(maybe_calls, list):
-                                calls = [c.copy() for c in maybe_calls if isinstance(c, dict)]
-                        if not calls and isinstance(stats_obj, dict):
-                            calls = [stats_obj]
-                        # Annotate origin/agent for downstream attribution
-                        stats_model = None
-                        try:
-                            if isinstance(stats_obj, dict):
-                                stats_model = stats_obj.get("model")
-                        except Exception:
-                            stats_model = None
-                        if not stats_model:
-                            stats_model = getattr(getattr(agent, "llm", None), "model", None)
-                        for c in calls:
-                            c.setdefault("origin", "solver")
-                            c.setdefault("agent", getattr(agent, "name", self.solver.name))
-                            if isinstance(c, dict) and not c.get("model") and stats_model:
-                                c["model"] = stats_model
-                        statistics = calls or None
-                    except Exception as exc:  # pragma: no cover - safeguard
-                        logger.debug(
-                            "Failed to collect solver statistics (%s): %s",
-                            getattr(agent, "name", "unknown"),
-                            exc,
-                        )
-                result = SolverRunResult(
-                    task=task,
-                    output=output,
-                    summary=summary,
-                    raw_output=solver_output,
-                    agent_name=getattr(agent, "name", self.solver.name),
-                    statistics=statistics,
+        if not tasks:
+            return []
+
+        # Solver hooks resolved once rather than per task
+        solver = self.solver
+        solver_name = solver.name
+        build_agent = solver.build_agent
+        build_request = solver.build_request
+        agent_pool_key = solver.agent_pool_key
+        extract_result = solver.extract_result
+        extract_summary = solver.extract_summary
+
+        async def _run(task: Any, rerun: bool = False) -> SolverRunResult:
+            # Emit start only when the task actually acquires a slot
+            await self._notify(SolverEvents.START, lambda: {"task": task})
+            await self._await_solver_warmup()
+            if self.dedupe_requests:
+                request = build_request(task, context=context)
+                result, model = await _solve_once(task, request, rerun)
+            else:
+                result, model = await _solve(task, None)
+            await self._notify(
+                SolverEvents.COMPLETED, lambda: _solver_completed_payload(result, model)
+            )
+            return result
+
+        async def _solve(task: Any, request: str | None) -> tuple[SolverRunResult, Any]:
+            pool_key = (
+                agent_pool_key(task, context=context)
+                if self.reuse_solver_agents
+                else None
+            )
+            if pool_key is not None:
+                agent = self._acquire_agent(
+                    ("solver", solver_name, pool_key),
+                    lambda: build_agent(task, **build_kwargs),
                 )
-                sanitized_result = {
-                    "output": result.output,
-                    "summary": result.summary,
-                    "agent_name": result.agent_name,
-                }
-                # Attach model used by the solver agent for easier client display
+            else:
+                agent = build_agent(task, **build_kwargs)
+            if request is None:
+                request = build_request(task, context=context)
+            solver_output = await agent.run(request)
+            output = extract_result(agent, solver_output, task, context=context)
+            summary = extract_summary(agent, solver_output, task, context=context)
+            agent_name = getattr(agent, "name", solver_name)
+            statistics: list[dict[str, Any]] | None = None
+            stats_model: Any = None
+            get_statistics = _statistics_getter(agent)
+            if get_statistics is not None:
                 try:
-                    if 'stats_model' in locals() and stats_model:
-                        sanitized_result["model"] = stats_model
-                    else:
-                        maybe_model = getattr(getattr(agent, "llm", None), "model", None)
-                        if maybe_model:
-                            sanitized_result["model"] = maybe_model
-                except Exception:
-                    pass
-                if statistics is not None:
-                    # statistics is a List[Dict] (per-call records)
-                    sanitized_result["statistics"] = statistics
-                await self._notify(
-                    SolverEvents.COMPLETED,
-                    {"task": task, "result": sanitized_result},
-                )
-                return result
+                    stats_obj = get_statistics()
+                    stats_model = _stats_model(stats_obj, agent)
+                    calls = _shape_call_records(stats_obj, "solver", agent_name, stats_model)
+                    statistics = calls or None
+                except Exception as exc:  # pragma: no cover - safeguard
+                    logger.debug(
+                        "Failed to collect solver statistics (%s): %s",
+                        getattr(agent, "name", "unknown"),
+                        exc,
+                    )
+            result = SolverRunResult(
+                task=task,
+                output=output,
+                summary=summary,
+                raw_output=solver_output,
+                agent_name=agent_name,
+                statistics=statistics,
+            )
 
-            if semaphore:
-                async with semaphore:
-                    return await _run()
-            return await _run()
+            model = stats_model or getattr(getattr(agent, "llm", None), "model", None)
+            return result, model
 
-        # Helpers to bind keys
-        def _task_key(task: Any) -> str:
-            try:
-                tid = getattr(task, "id", None)
-                if tid is None and isinstance(task, dict):
-                    tid = task.get("id")
-                return f"task:{tid}" if tid is not None else f"task_obj:{id(task)}"
-            except Exception:
-                return f"task_obj:{id(task)}"
+        # Solves by request text, shared by tasks whose requests are identical
+        solved: dict[str, asyncio.Future[tuple[SolverRunResult, Any]]] = {}
 
-        async def _launch(task: Any) -> None:
-            key = _task_key(task)
-            coro = _execute(task)
-            fut = asyncio.create_task(coro)
-            async with self._lock:
+        async def _solve_once(
+            task: Any, request: str, rerun: bool
+        ) -> tuple[SolverRunResult, Any]:
+            pending = None if rerun else solved.get(request)
+            if pending is not None:
+                try:
+                    # Shielded so cancelling this task leaves the shared solve alone
+                    result, model = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # The solving task was cancelled; solve this one itself
+                else:
+                    # Same answer, but no LLM calls were made for this task
+                    return replace(result, task=task, statistics=None), model
+            pending = solved[request] = asyncio.get_running_loop().create_future()
+            try:
+                outcome = await _solve(task, request)
+            except BaseException as exc:
+                if solved.get(request) is pending:
+                    del solved[request]
+                if isinstance(exc, asyncio.CancelledError):
+                    pending.cancel()
+                else:
+                    pending.set_exception(exc)
+                    pending.exception()  # waiters re-raise it; avoid the unretrieved warning
+                raise
+            pending.set_result(outcome)
+            return outcome
+
+        queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue()
+        results: list[SolverRunResult | None] = [None] * len(tasks)
+
+        failure: BaseException | None = None
+        failed: set[int] = set()
+        # Task indexes started at least once; restarts must not reuse a solve
+        attempted: set[int] = set()
+
+        def _abort(exc: BaseException) -> None:
+            nonlocal failure
+            failure = exc
+            self._restart_requests.clear()
+            # Drop queued work; join() returns once running tasks settle
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                queue.task_done()
+                if item is not None:
+                    self._queued_keys.discard(item[1])
+            running = list(self._active_solver_tasks.values())
+            for fut in running:
+                fut.cancel()
+
+        async def _process(index: int, key: str) -> None:
+            task = tasks[index]
+            rerun = index in attempted
+            attempted.add(index)
+            self._queued_keys.discard(key)
+            # Cancelled while still queued, or the run is aborting
+            cancelled = failure is not None or key in self._cancel_requests
+            self._cancel_requests.discard(key)
+            result: SolverRunResult | None = None
+            exc: BaseException | None = None
+            if cancelled:
+                pass
+            elif not self.task_control:
+                # Nothing can cancel or restart it, so skip the per-task Task
+                try:
+                    result = await _run(task, rerun)
+                except Exception as err:
+                    exc = err
+            else:
+                fut = asyncio.create_task(_run(task, rerun))
                 self._active_solver_tasks[key] = fut
-                self._task_key_map[key] = task
+                # asyncio.wait does not raise when fut itself is cancelled
+                await asyncio.wait((fut,))
+                if self._active_solver_tasks.get(key) is fut:
+                    self._active_solver_tasks.pop(key)
+                if fut.cancelled():
+                    cancelled = True
+                elif (exc := fut.exception()) is None:
+                    result = fut.result()
+
+            if cancelled:
+                await self._notify(SolverEvents.CANCELLED, lambda: {"task": task})
+            elif exc is not None:
+                logger.error("Solver task failed for {}: {}", key, exc)
+                await self._notify(
+                    SolverEvents.STEP_FAILED,
+                    lambda: {"task": task, "error": str(exc), "error_type": type(exc).__name__},
+                )
+                if self.fail_fast:
+                    if failure is None:
+                        _abort(exc)
+                else:
+                    failed.add(index)
+                    if self.record_failures:
+                        results[index] = SolverRunResult(
+                            task=task,
+                            output=None,
+                            summary=f"error: {exc}",
+                            raw_output=None,
+                            agent_name=solver_name,
+                        )
+            else:
+                failed.discard(index)
+                results[index] = result
+                if result.statistics:
+                    self._solver_statistics[index] = result.statistics
+                if on_result is not None:
+                    on_result(result)
+
+            if failure is not None:
+                return
+            if (
+                results[index] is not None
+                and index not in failed
+                and index not in completed
+            ):
+                # First completion releases dependents whose last
+                # prerequisite this was
+                completed.add(index)
+                for child in children[index]:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        child_key = keys[child]
+                        self._waiting_keys.discard(child_key)
+                        self._queued_keys.add(child_key)
+                        _enqueue(child, child_key)
+            restart = key in self._restart_requests
+            self._restart_requests.discard(key)
+            if restart:
+                self._queued_keys.add(key)
+                _enqueue(index, key)
+                await self._notify(SolverEvents.RESTARTED, lambda: {"task": task})
+
+        async def _worker() -> None:
+            nonlocal idle
+            while True:
+                item = await queue.get()
+                idle -= 1
+                try:
+                    if item is None:
+                        return
+                    await _process(*item)
+                finally:
+                    queue.task_done()
+                    idle += 1
+
+        workers: list[asyncio.Task] = []
+        worker_limit = min(self.concurrency or len(tasks), len(tasks))
+        # Workers waiting for an item, counting those not yet started
+        idle = 0
+
+        def _enqueue(index: int, key: str) -> None:
+            nonlocal idle
+            queue.put_nowait((index, key))
+            if queue.qsize() > idle and len(workers) < worker_limit:
+                idle += 1
+                workers.append(asyncio.create_task(_worker()))
+
+        # Dependency graph: only tasks with no pending prerequisites are
+        # queued; the rest are released as their prerequisites complete
+        keys = [self._task_key(t) for t in tasks]
+        index_of = {key: index for index, key in enumerate(keys)}
+        children: list[list[int]] = [[] for _ in tasks]
+        indegree = [0] * len(tasks)
+        completed: set[int] = set()
+        for index, t in enumerate(tasks):
+            for dep in set(self.planner.dependencies_of(t)):
+                parent = index_of.get(f"task:{dep}")
+                if parent is None or parent == index:
+                    logger.warning("Ignoring invalid dependency {!r} of {}", dep, keys[index])
+                    continue
+                children[parent].append(index)
+                indegree[index] += 1
+
+        if not any(indegree) and type(solver).run_batch is not SolverAgent.run_batch:
+            batch_results = await self._run_solver_batch(tasks, context, on_result=on_result)
+            await self._flush_notifications()
+            return batch_results
+
+        # Built once per run and handed to every build_agent that accepts it
+        shared = solver.build_shared_resources(context)
+        if "shared" in inspect.signature(build_agent).parameters:
+            build_kwargs = {"context": context, "shared": shared}
+        else:
+            build_kwargs = {"context": context}
 
         # Initialize
-        async with self._lock:
-            self._active_solver_tasks.clear()
-            self._task_key_map = { _task_key(t): t for t in tasks }
-            self._cancel_requests.clear()
-            self._restart_requests.clear()
-            self._results_map.clear()
-
-        for t in tasks:
-            await _launch(t)
-
-        # Dynamic wait loop
-        while True:
-            async with self._lock:
-                pending = list(self._active_solver_tasks.items())
-                restart_keys = list(self._restart_requests)
-
-            if not pending and not restart_keys:
-                break
-
-            # Schedule restarts that are requested but not active
-            for rkey in restart_keys:
-                async with self._lock:
-                    is_active = rkey in self._active_solver_tasks
-                    task_obj = self._task_key_map.get(rkey)
-                    if task_obj is None:
-                        # Unknown key; ignore
-                        self._restart_requests.discard(rkey)
-                        continue
-                if not is_active:
-                    await self._notify(SolverEvents.RESTARTED, {"task": task_obj})
-                    await _launch(task_obj)
-                    async with self._lock:
-                        self._restart_requests.discard(rkey)
-
-            # Recompute pending set after possible launches
-            async with self._lock:
-                futures = list(self._active_solver_tasks.items())
+        self._active_solver_tasks.clear()
+        self._task_key_map.clear()
+        self._task_index_map.clear()
+        self._queued_keys.clear()
+        self._waiting_keys.clear()
+        self._solver_statistics.clear()
+        self._cancel_requests.clear()
+        self._restart_requests.clear()
+        for index, t in enumerate(tasks):
+            key = keys[index]
+            self._task_key_map[key] = t
+            self._task_index_map[key] = index
+            if indegree[index]:
+                self._waiting_keys.add(key)
+            else:
+                self._queued_keys.add(key)
+                _enqueue(index, key)
+        self._enqueue_solver = _enqueue
 
-            if not futures:
-                continue
+        try:
+            # Restarts re-enqueue before task_done, so join() waits for them
+            await queue.join()
+            self._enqueue_solver = None
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        finally:
+            self._enqueue_solver = None
+            active = list(self._active_solver_tasks.values())
+            for fut in active:
+                fut.cancel()
+            for worker in workers:
+                worker.cancel()
+
+        blocked = sorted(self._waiting_keys)
+        self._waiting_keys.clear()
+        if failure is None:
+            if blocked:
+                logger.warning(
+                    "Solver tasks never became ready (failed prerequisite or cycle): {}",
+                    ", ".join(blocked),
+                )
+            for key in blocked:
+                blocked_task = self._task_key_map[key]
+                await self._notify(
+                    SolverEvents.CANCELLED,
+                    lambda blocked_task=blocked_task: {"task": blocked_task, "reason": "blocked"},
+                )
+        await self._flush_notifications()
+        if failure is not None:
+            raise failure
 
-            # Wait for any completion
-            done, _pending = await asyncio.wait(
-                {f for _, f in futures}, return_when=asyncio.FIRST_COMPLETED
-            )
+        return [res for res in results if res is not None]
 
-            # Process completed
-            for done_fut in done:
-                # Find key by value
-                key_for_done = None
-                for k, f in futures:
-                    if f is done_fut:
-                        key_for_done = k
-                        break
-                if key_for_done is None:
-                    continue
+    async def _run_solver_batch(
+        self,
+        tasks: Sequence[Any],
+        context: PlanContext,
+        *,
+        on_result: Callable[[SolverRunResult], Any] | None = None,
+    ) -> list[SolverRunResult]:
+        """Solve all tasks through one ``SolverAgent.run_batch`` call.
 
-                async with self._lock:
-                    # Remove from active
-                    self._active_solver_tasks.pop(key_for_done, None)
-                    task_obj = self._task_key_map.get(key_for_done)
+        A failing batch fails every task in it, following the same
+        ``fail_fast`` / ``record_failures`` rules as per-task solving.
+        """
+        self._solver_statistics.clear()
+        for task in tasks:
+            await self._notify(SolverEvents.START, lambda task=task: {"task": task})
+        await self._await_solver_warmup()
+        try:
+            results = list(await self.solver.run_batch(tasks, context=context))
+            if len(results) != len(tasks):
+                raise RuntimeError(
+                    f"Solver '{self.solver.name}' returned {len(results)} batch results "
+                    f"for {len(tasks)} tasks."
+                )
+        except Exception as exc:
+            logger.error("Solver batch failed for {} tasks: {}", len(tasks), exc)
+            error = {"error": str(exc), "error_type": type(exc).__name__}
+            for task in tasks:
+                await self._notify(
+                    SolverEvents.STEP_FAILED, lambda task=task: {"task": task, **error}
+                )
+            if self.fail_fast:
+                await self._flush_notifications()
+                raise
+            if not self.record_failures:
+                return []
+            return [
+                SolverRunResult(
+                    task=task,
+                    output=None,
+                    summary=f"error: {exc}",
+                    raw_output=None,
+                    agent_name=self.solver.name,
+                )
+                for task in tasks
+            ]
+        for index, result in enumerate(results):
+            if result.statistics:
+                self._solver_statistics[index] = result.statistics
+            if on_result is not None:
+                on_result(result)
+            model = next(
+                (c["model"] for c in result.statistics or () if c.get("model")), None
+            )
+            await self._notify(
+                SolverEvents.COMPLETED,
+                lambda result=result, model=model: _solver_completed_payload(result, model),
+            )
+        return results
 
-                try:
-                    res: SolverRunResult = await done_fut
-                except asyncio.CancelledError:
-                    # Cancelled: emit event and continue; restart is handled above
-                    await self._notify(SolverEvents.CANCELLED, {"task": task_obj})
-                    continue
-                except Exception as exc:  # pragma: no cover - safeguard
-                    logger.error("Solver task failed for %s: %s", key_for_done, exc)
-                    continue
+    def _start_solver_warmup(self) -> None:
+        """Start ``SolverAgent.warmup`` once, if the solver overrides it."""
+        if self._solver_warmup is None and type(self.solver).warmup is not SolverAgent.warmup:
+            self._solver_warmup = asyncio.create_task(self.solver.warmup())
 
-                # Store successful result
-                async with self._lock:
-                    self._results_map[key_for_done] = res
-
-        # Collect results in original order (where available)
-        results: list[SolverRunResult] = []
-        for t in tasks:
-            key = _task_key(t)
-            res = self._results_map.get(key)
-            if res is not None:
-                results.append(res)
-        # Also include any restarted-only completions (if original was cancelled)
-        known_keys = { _task_key(t) for t in tasks }
-        for k, res in self._results_map.items():
-            if k not in known_keys:
-                results.append(res)
+    async def _await_solver_warmup(self) -> None:
+        """Wait for the solver warmup, if any; failures only get logged.
 
-        return results
+        Starts it first when solving without planning (e.g., client-provided
+        tasks or a restart after completion).
+        """
+        self._start_solver_warmup()
+        warmup = self._solver_warmup
+        if warmup is None or self._solver_warmup_settled:
+            return
+        try:
+            # Shielded so a cancelled solver does not cancel the shared warmup
+            await asyncio.shield(warmup)
+        except asyncio.CancelledError:
+            if not warmup.cancelled():
+                raise
+        except Exception as exc:
+            if not self._solver_warmup_settled:
+                logger.warning("Solver warmup failed for {}: {}", self.solver.name, exc)
+        self._solver_warmup_settled = True
+
+    def _acquire_agent(
+        self, key: tuple[Hashable, ...], build: Callable[[], BaseAgent]
+    ) -> BaseAgent:
+        """Return a fresh agent for ``key``, cloned from a pooled template.
+
+        The first call builds the template; later calls copy it with its
+        initial memory, sharing the LLM client instead of rebuilding it
+        (tool agents copy their tools per clone, so one run's cleanup cannot
+        close another's). Reuse assumes the built agent depends only on the
+        key (planner, or the solver's ``agent_pool_key``), and the pool is only
+        touched from the pipeline's event loop, so it needs no lock.
+        Templates beyond ``max_pooled_agents`` are evicted LRU-first.
+        """
+        template = self._agent_pool.get(key)
+        if template is None:
+            template = build()
+            if not isinstance(template, BaseAgent):
+                return template
+            self._agent_pool[key] = template
+            while len(self._agent_pool) > self.max_pooled_agents:
+                self._agent_pool.popitem(last=False)
+        else:
+            self._agent_pool.move_to_end(key)
+        agent = template._clone_for_request()
+        if template.memory.messages:
+            agent.memory.add_messages(list(template.memory.messages))
+        return agent
 
     # ---- External control API for per-task management ----
     def _task_key(self, task: Any) -> str:
@@ -539,10 +1106,16 @@ class PlanSolverPipeline:
 
         Returns True if a matching active task was found and cancelled.
         """
+        if not self.task_control:
+            return False
         # Build key candidates
         key = f"task:{task_id}"
         async with self._lock:
             fut = self._active_solver_tasks.get(key)
+            if fut is None and (key in self._queued_keys or key in self._waiting_keys):
+                # Not started yet; the worker skips it when dequeued
+                self._cancel_requests.add(key)
+                return True
         if fut and not fut.done():
             fut.cancel()
             return True
@@ -550,12 +1123,32 @@ class PlanSolverPipeline:
 
     async def request_restart_solver_task(self, task_id: int | str) -> bool:
         """Request a solver task to be restarted (cancel if running, then relaunch)."""
+        if not self.task_control:
+            return False
         key = f"task:{task_id}"
+        relaunch = False
         async with self._lock:
-            self._restart_requests.add(key)
             fut = self._active_solver_tasks.get(key)
+            if key in self._queued_keys or key in self._waiting_keys:
+                # Not started yet; just drop any pending cancel
+                self._cancel_requests.discard(key)
+            elif (
+                fut is None
+                and self._enqueue_solver is not None
+                and key in self._task_index_map
+            ):
+                # Finished or cancelled earlier in this run; enqueue it again
+                relaunch = True
+                self._queued_keys.add(key)
+                self._enqueue_solver(self._task_index_map[key], key)
+            else:
+                # The worker re-enqueues it once the running task ends
+                self._restart_requests.add(key)
         if fut and not fut.done():
             fut.cancel()
+        if relaunch:
+            task_obj = self._task_key_map.get(key)
+            await self._notify(SolverEvents.RESTARTED, lambda: {"task": task_obj})
         return True
 
     async def _run_aggregator(
@@ -563,81 +1156,169 @@ class PlanSolverPipeline:
     ) -> Any:
         if not self.aggregator:
             return None
+        if self.stream_aggregator:
+            stream: asyncio.Queue[SolverRunResult | None] = asyncio.Queue()
+            for result in results:
+                stream.put_nowait(result)
+            stream.put_nowait(None)
+            aggregate = await self._run_stream_aggregator(context, stream)
+            await self._flush_notifications()
+            return aggregate
+        await self._notify(
+            AggregateEvents.START, lambda: {"context": context, "solver_results": results}
+        )
+        aggregate = self._aggregator(context, results)  # type: ignore[misc]
+        if self._aggregator_is_coro or inspect.isawaitable(aggregate):
+            aggregate = await aggregate  # type: ignore[assignment]
         await self._notify(
-            AggregateEvents.START, {"context": context, "solver_results": results}
+            AggregateEvents.COMPLETED,
+            lambda: {"context": context, "solver_results": results, "output": aggregate},
         )
-        aggregate = self.aggregator(context, results)
-        if inspect.isawaitable(aggregate):
+        await self._flush_notifications()
+        return aggregate
+
+    async def _run_stream_aggregator(
+        self, context: PlanContext, stream: asyncio.Queue[SolverRunResult | None]
+    ) -> Any:
+        """Run a streaming aggregator over results pushed to ``stream``.
+
+        ``None`` on the queue ends the iteration.
+        """
+        streamed: list[SolverRunResult] = []
+
+        async def _iter_results() -> AsyncIterator[SolverRunResult]:
+            while (result := await stream.get()) is not None:
+                streamed.append(result)
+                yield result
+
+        await self._notify(
+            AggregateEvents.START, lambda: {"context": context, "solver_results": streamed}
+        )
+        aggregate = self._aggregator(context, _iter_results())  # type: ignore[misc]
+        if self._aggregator_is_coro or inspect.isawaitable(aggregate):
             aggregate = await aggregate  # type: ignore[assignment]
         await self._notify(
             AggregateEvents.COMPLETED,
-            {"context": context, "solver_results": results, "output": aggregate},
+            lambda: {"context": context, "solver_results": streamed, "output": aggregate},
         )
         return aggregate
 
     def _build_pipeline_statistics(
-        self,
-        plan_statistics: list[dict[str, Any]] | None,
-        solver_results: Sequence[SolverRunResult],
+        self, plan_statistics: list[dict[str, Any]] | None
     ) -> list[dict[str, Any]] | None:
         """Build unified per-call statistics list for the entire pipeline.
 
         Returns a List[Dict], where each dict represents a single LLM call.
+        The planner and solver runs already store copied call records
+        annotated with origin/agent; solver records are collected by
+        _run_solvers as results arrive, so they are concatenated as-is.
         """
-        combined_calls: list[dict[str, Any]] = []
+        solver_statistics = self._solver_statistics
+        if not plan_statistics and not solver_statistics:
+            return None
+        combined_calls: list[dict[str, Any]] = list(plan_statistics or ())
+        for index in sorted(solver_statistics):
+            combined_calls.extend(solver_statistics[index])
+        return combined_calls
 
-        # Helper to append calls while ensuring origin/agent annotations
-        def _append_calls(calls: list[dict[str, Any]] | None, origin: str, agent_name: str) -> None:
-            if not calls:
-                return
-            for call in calls:
-                if not isinstance(call, dict):
-                    continue
-                entry = call.copy()
-                entry.setdefault("origin", origin)
-                entry.setdefault("agent", agent_name)
-                combined_calls.append(entry)
-
-        if plan_statistics:
-            # Try to infer agent name from any call entry; fallback to planner name
-            agent_name = self.planner.name
-            if isinstance(plan_statistics, list) and plan_statistics:
-                a = plan_statistics[0]
-                if isinstance(a, dict) and isinstance(a.get("agent"), str):
-                    agent_name = a.get("agent") or agent_name
-            _append_calls(plan_statistics, "plan", agent_name)
-
-        for result in solver_results:
-            if result.statistics:
-                _append_calls(result.statistics, "solver", result.agent_name)
+    # Coroutine-ness of the callbacks is checked once on assignment, so the
+    # per-event path can await without probing the returned object.
+    @property
+    def progress_callback(self) -> ProgressCallback | None:
+        return self._progress_callback
 
-        return combined_calls or None
+    @progress_callback.setter
+    def progress_callback(self, callback: ProgressCallback | None) -> None:
+        self._progress_callback = callback
+        self._progress_is_coro = inspect.iscoroutinefunction(callback)
+
+    @property
+    def aggregator(self) -> AggregateFn | AsyncAggregateFn | AsyncStreamAggregateFn | None:
+        return self._aggregator
+
+    @aggregator.setter
+    def aggregator(
+        self, aggregator: AggregateFn | AsyncAggregateFn | AsyncStreamAggregateFn | None
+    ) -> None:
+        self._aggregator = aggregator
+        self._aggregator_is_coro = inspect.iscoroutinefunction(aggregator)
 
     def set_progress_callback(self, callback: ProgressCallback | None) -> None:
         """Register a callback for pipeline progress events."""
         self.progress_callback = callback
 
-    async def _notify(self, event: str, payload: dict[str, Any]) -> None:
-        if not self.progress_callback:
+    async def _notify(
+        self, event: str, payload_fn: Callable[[], dict[str, Any]]
+    ) -> None:
+        """Send a progress event; the payload is only built when someone listens.
+
+        With ``background_notify`` the event is queued for a drain task, so
+        solvers do not wait on callback I/O; each stage flushes the queue
+        before returning.
+        """
+        callback = self._progress_callback
+        if not callback:
             return
+        if not self.background_notify:
+            await self._deliver(callback, self._progress_is_coro, event, payload_fn())
+            return
+        if self._notify_task is None:
+            self._notify_queue = asyncio.Queue(maxsize=1024)
+            self._notify_task = asyncio.create_task(
+                self._drain_notifications(self._notify_queue)
+            )
+        # Blocks only when the callback has fallen 1024 events behind
+        await self._notify_queue.put(
+            (callback, self._progress_is_coro, event, payload_fn())
+        )
+
+    async def _deliver(
+        self, callback: ProgressCallback, is_coro: bool, event: str, payload: dict[str, Any]
+    ) -> None:
         try:
-            outcome = self.progress_callback(event, payload)
-            if inspect.isawaitable(outcome):
+            outcome = callback(event, payload)
+            if is_coro or (outcome is not None and inspect.isawaitable(outcome)):
                 await outcome  # type: ignore[func-returns-value]
         except Exception as exc:  # pragma: no cover - safeguard
             logger.debug(
-                "PlanSolverPipeline progress callback failed (%s): %s", event, exc
+                "PlanSolverPipeline progress callback failed ({}): {}", event, exc
             )
 
+    async def _drain_notifications(
+        self, queue: asyncio.Queue[tuple[Any, ...] | None]
+    ) -> None:
+        while (item := await queue.get()) is not None:
+            await self._deliver(*item)
+
+    async def _flush_notifications(self) -> None:
+        """Deliver queued background events and stop the drain task."""
+        task, queue = self._notify_task, self._notify_queue
+        if task is None or queue is None:
+            return
+        self._notify_task = self._notify_queue = None
+        await queue.put(None)
+        await task
+
 
 def create_plan_solver(
     *,
     name: str = "plan_solver",
     planner: PlanAgent,
     solver: SolverAgent,
-    aggregator: AggregateFn | AsyncAggregateFn | None = None,
+    aggregator: AggregateFn | AsyncAggregateFn | AsyncStreamAggregateFn | None = None,
+    stream_aggregator: bool = False,
     concurrency: int | None = None,
     progress_callback: ProgressCallback | None = None,
+    plan_cache: PlanCache | None = None,
+    reuse_plan_agent: bool = False,
+    reuse_solver_agents: bool = False,
+    max_pooled_agents: int = 8,
+    fail_fast: bool = False,
+    record_failures: bool = False,
+    capture_calls: bool = True,
+    task_control: bool = True,
+    background_notify: bool = False,
+    dedupe_requests: bool = False,
 ) -> PlanSolverPipeline:
     """Factory helper for constructing plan→solve pipelines.
 
@@ -646,8 +1327,30 @@ def create_plan_solver(
         planner: Concrete PlanAgent implementation.
         solver: Concrete SolverAgent implementation used for each task.
         aggregator: Optional function combining all solver results.
+        stream_aggregator: Call the aggregator with an async iterator of results
+            in completion order, so aggregation overlaps with solving.
         concurrency: Max concurrent solver executions (None = unlimited).
         progress_callback: Optional coroutine/callback for pipeline progress events.
+        plan_cache: Optional PlanCache reusing planner output for repeated questions.
+        reuse_plan_agent: Build the planning agent once and run copies of it.
+        reuse_solver_agents: Run copies of one built solver agent for tasks that
+            share a ``SolverAgent.agent_pool_key``; no effect unless the solver
+            overrides it.
+        max_pooled_agents: Max template agents kept when reuse is enabled.
+        fail_fast: Cancel remaining solvers and raise on the first failure
+            instead of skipping the failed task.
+        record_failures: Return failed tasks as results with ``output=None`` and
+            an ``error: ...`` summary instead of leaving them out; aggregators
+            must then handle missing outputs.
+        capture_calls: Build the pipeline-wide per-call statistics list; when
+            False, pipeline.completed carries only a ``call_count``.
+        task_control: Support per-task cancel/restart requests; disable when
+            nothing calls them to run each solver without a separate task.
+        background_notify: Deliver progress events from a background task so
+            solvers do not wait on callback I/O; flushed at the end of each stage.
+        dedupe_requests: Solve tasks with identical solver requests once per run
+            and reuse the result; only valid when build_agent and the result
+            extraction do not depend on anything outside the request.
 
     Returns:
         Configured PlanSolverPipeline ready to execute via `run()`.
@@ -655,6 +1358,8 @@ def create_plan_solver(
 
     if concurrency is not None and concurrency <= 0:
         raise ValueError("concurrency must be a positive integer when provided.")
+    if max_pooled_agents <= 0:
+        raise ValueError("max_pooled_agents must be a positive integer.")
 
     if not isinstance(planner, PlanAgent):
         raise TypeError("planner must be an instance of PlanAgent.")
@@ -666,11 +1371,121 @@ def create_plan_solver(
         planner=planner,
         solver=solver,
         aggregator=aggregator,
+        stream_aggregator=stream_aggregator,
         concurrency=concurrency,
         progress_callback=progress_callback,
+        plan_cache=plan_cache,
+        reuse_plan_agent=reuse_plan_agent,
+        reuse_solver_agents=reuse_solver_agents,
+        max_pooled_agents=max_pooled_agents,
+        fail_fast=fail_fast,
+        record_failures=record_failures,
+        capture_calls=capture_calls,
+        task_control=task_control,
+        background_notify=background_notify,
+        dedupe_requests=dedupe_requests,
     )
 
 
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+_LIST_LIKE_TYPES = frozenset({list, tuple, set, frozenset})
+
+# Nesting limit for payload walks; deeper (or self-referencing) payloads raise
+# RecursionError as the recursive converter used to
+_MAX_SERIALIZE_DEPTH = 1000
+
+# Converter per concrete payload type, chosen on first sight so repeated
+# events skip the dataclass/dict/list/model probing. Each entry maps a value
+# to either a finished result or a dict/list whose values still need walking.
+_SERIALIZERS: dict[type, tuple[Callable[[Any], Any], bool]] = {}
+
+
+def _make_serializable(value: Any) -> Any:
+    """Convert an event payload into JSON-friendly builtins.
+
+    Walks the payload with an explicit stack instead of recursing: each
+    container is copied wholesale and only its non-primitive values are
+    pushed back for conversion, so statistics dicts and lists of primitives
+    are a single copy.
+    """
+    if type(value) in _PRIMITIVE_TYPES:
+        return value
+    root = [value]
+    stack = [(root, 0, value, 0)]
+    primitive = _PRIMITIVE_TYPES
+    while stack:
+        parent, key, item, depth = stack.pop()
+        cls = type(item)
+        if cls in primitive:
+            parent[key] = item
+            continue
+        if cls is not dict and cls not in _LIST_LIKE_TYPES:
+            entry = _SERIALIZERS.get(cls)
+            if entry is None:
+                entry = _SERIALIZERS[cls] = _build_serializer(cls)
+            convert, walk = entry
+            item = convert(item)
+            if not walk or type(item) in primitive:
+                parent[key] = item
+                continue
+        if depth >= _MAX_SERIALIZE_DEPTH:
+            raise RecursionError("event payload is nested too deeply to serialize")
+        depth += 1
+        if type(item) is dict:
+            out = parent[key] = dict(item)
+            for k, v in out.items():
+                if type(v) not in primitive:
+                    stack.append((out, k, v, depth))
+        else:
+            out = parent[key] = list(item)
+            for i, v in enumerate(out):
+                if type(v) not in primitive:
+                    stack.append((out, i, v, depth))
+    return root[0]
+
+
+def _public_attrs(value: Any) -> Any:
+    if hasattr(value, "__dict__"):
+        return {k: v for k, v in vars(value).items() if not k.startswith("_")}
+    return str(value)
+
+
+def _build_serializer(cls: type) -> tuple[Callable[[Any], Any], bool]:
+    if issubclass(cls, (str, int, float, bool)):
+        return (lambda value: value), False
+    if is_dataclass(cls):
+        # Shallow field dict; the walk converts nested values without asdict's deep copy
+        names = tuple(f.name for f in fields(cls))
+        return (lambda value: {name: getattr(value, name) for name in names}), True
+    if issubclass(cls, dict):
+        return dict, True
+    if issubclass(cls, (list, tuple, set, frozenset)):
+        return list, True
+    if hasattr(cls, "model_dump"):
+        dump_name = "model_dump"
+    elif hasattr(cls, "dict"):
+        dump_name = "dict"
+    else:
+        return _public_attrs, True
+
+    def _serialize_model(value: Any) -> Any:
+        try:
+            return getattr(value, dump_name)()
+        except Exception:  # pragma: no cover - best effort
+            return _make_serializable(_public_attrs(value))
+
+    return _serialize_model, False
+
+
+def _task_id(task: Any) -> Any:
+    try:
+        if isinstance(task, dict):
+            return task.get("id")
+        return getattr(task, "id", None)
+    except Exception:
+        return None
+
+
 class PlanSolverSessionAgent(BaseAgent):
     """Wrap PlanSolverPipeline as a WebSocket-aware BaseAgent."""
 
@@ -691,11 +1506,71 @@ class PlanSolverSessionAgent(BaseAgent):
         default=300,
         description="Timeout (seconds) for plan confirmation before proceeding or aborting.",
     )
+    subscribed_events: set[str] | None = Field(
+        default=None,
+        description="Pipeline progress events to forward (e.g., {'solver.completed'}); None forwards all.",
+    )
+    event_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Max events coalesced into one pipeline.batch message; 1 sends each event on its own.",
+    )
+    event_flush_interval_ms: int = Field(
+        default=20,
+        ge=0,
+        description="How long a batch waits for more events before it is sent.",
+    )
+    reference_tasks: bool = Field(
+        default=False,
+        description=(
+            "Tag task lists with a tasks_ref digest and send the full list only the first time "
+            "that digest is sent in a run; later events carry just tasks_ref."
+        ),
+    )
+    defer_serialization: bool = Field(
+        default=False,
+        description=(
+            "Hand payload objects to the WebSocket JSON encoder (orjson when installed) "
+            "instead of converting them to builtins first; payloads must not be mutated after emission."
+        ),
+    )
+
+    _emit_queue: asyncio.Queue[dict[str, Any] | None] | None = PrivateAttr(default=None)
+    # Namespaced event names by event, valid for _event_names_namespace
+    _event_names: dict[str, str] = PrivateAttr(default_factory=dict)
+    _event_names_namespace: str | None = PrivateAttr(default=None)
+    # Serialized task payloads by id() for the current run; the task itself
+    # is kept alongside so its id cannot be reused while cached
+    _serialized_tasks: dict[int, tuple[Any, Any]] = PrivateAttr(default_factory=dict)
+    # tasks_ref digests whose full task list went out in the current run
+    _sent_task_refs: set[str] = PrivateAttr(default_factory=set)
+    # (context, {str(task id): task}) for restarts after completion
+    _task_index: tuple[PlanContext, dict[str, Any]] | None = PrivateAttr(default=None)
+    # (session, session_id, send) resolved for the last session seen
+    _session_bind: tuple[Any, str | None, Callable[[dict[str, Any]], Awaitable[Any]]] | None = PrivateAttr(
+        default=None
+    )
 
     class Config:
         arbitrary_types_allowed = True
 
     async def run(self, question: str | None = None) -> str:
+        self._serialized_tasks.clear()
+        self._sent_task_refs.clear()
+        if self.event_batch_size <= 1:
+            return await self._run_session(question)
+
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._emit_queue = queue
+        flush_task = asyncio.create_task(self._flush_events(queue))
+        try:
+            return await self._run_session(question)
+        finally:
+            self._emit_queue = None
+            queue.put_nowait(None)
+            await flush_task
+
+    async def _run_session(self, question: str | None) -> str:
         if not question:
             raise ValueError("PlanSolverSessionAgent requires a question to run.")
 
@@ -764,7 +1639,7 @@ class PlanSolverSessionAgent(BaseAgent):
                 # Coerce edited tasks if provided
                 if edited_tasks is not None:
                     try:
-                        edited_tasks = list(self.pipeline.planner.coerce_tasks(edited_tasks))
+                        edited_tasks = tuple(self.pipeline.planner.coerce_tasks(edited_tasks))
                     except Exception as exc:
                         await self._emit_event(
                             PlanEvents.COERCION_ERROR,
@@ -808,15 +1683,17 @@ class PlanSolverSessionAgent(BaseAgent):
         raise NotImplementedError("PlanSolverSessionAgent executes via run().")
 
     async def _progress_callback(self, event: str, payload: dict[str, Any]) -> None:
-        content = self._make_serializable(payload)
+        if self.subscribed_events is not None and event not in self.subscribed_events:
+            return
+        if event == PlanEvents.COMPLETED and not self.broadcast_tasks:
+            # Drop tasks before serializing so they are never converted
+            payload = {k: v for k, v in payload.items() if k != "tasks"}
+        content = self._serialize_payload(payload)
         metadata: dict[str, Any] | None = None
 
         # Move statistics/metrics into metadata for specific events
         try:
             if event == PlanEvents.COMPLETED:
-                # Optionally drop tasks from content based on broadcast setting
-                if not self.broadcast_tasks:
-                    content = {k: v for k, v in content.items() if k != "tasks"}
                 # Extract statistics/metrics
                 stats = content.pop("statistics", None)
                 metrics = content.pop("metrics", None)
@@ -849,49 +1726,178 @@ class PlanSolverSessionAgent(BaseAgent):
             # Non-critical; continue without metadata reshaping if something goes wrong
             metadata = metadata or None
 
-        await self._emit_event(event, content, metadata=metadata)
+        # content and metadata were built from the already serialized payload
+        await self._emit_event(event, content, metadata=metadata, serialized=True)
 
-    async def _emit_event(self, event: str, content: Any, *, metadata: dict[str, Any] | None = None, step_id: str | None = None) -> None:
+    async def _emit_event(
+        self,
+        event: str,
+        content: Any,
+        *,
+        metadata: dict[str, Any] | None = None,
+        step_id: str | None = None,
+        serialized: bool = False,
+    ) -> None:
         session = get_ws_session_context()
         if not session:
             return
 
-        if self.event_namespace:
-            event_type = f"{self.event_namespace}.{event}"
+        event_type = self._event_type(event)
+        _, session_id, send = self._bind_session(session)
+        if serialized or self.defer_serialization:
+            # Already JSON-safe, or left for the event encoder to convert
+            serial_content, serial_metadata = content, metadata
         else:
-            event_type = event
-        session_id = getattr(session, "session_id", None)
-        # Ensure payloads are JSON-serializable
-        serial_content = self._make_serializable(content)
-        serial_metadata = self._make_serializable(metadata) if metadata is not None else None
+            # Ensure payloads are JSON-serializable
+            serial_content = self._make_serializable(content)
+            serial_metadata = self._make_serializable(metadata) if metadata is not None else None
         ws_event = create_event(event_type, session_id=session_id, content=serial_content, metadata=serial_metadata, step_id=step_id)
 
-        if hasattr(session, "_send_event"):
-            await session._send_event(ws_event)  # type: ignore[attr-defined]
-        else:
-            await send_websocket_message(session.websocket, ws_event)  # type: ignore[attr-defined]
+        if self._emit_queue is not None:
+            self._emit_queue.put_nowait(ws_event)
+            return
+        await send(ws_event)
+        if self.reference_tasks:
+            self._mark_tasks_sent(serial_content)
+
+    def _event_type(self, event: str) -> str:
+        """Return the event name with the namespace prefix, if any."""
+        if self._event_names_namespace != self.event_namespace:
+            self._event_names = {}
+            self._event_names_namespace = self.event_namespace
+        event_type = self._event_names.get(event)
+        if event_type is None:
+            event_type = f"{self.event_namespace}.{event}" if self.event_namespace else event
+            self._event_names[event] = event_type
+        return event_type
+
+    def _bind_session(
+        self, session: Any
+    ) -> tuple[Any, str | None, Callable[[dict[str, Any]], Awaitable[Any]]]:
+        """Return (session, session_id, send) for ``session``, resolved once per session."""
+        bind = self._session_bind
+        if bind is None or bind[0] is not session:
+            if hasattr(session, "_send_event"):
+                send = session._send_event  # type: ignore[attr-defined]
+            else:
+                send = partial(send_websocket_message, session.websocket)  # type: ignore[attr-defined]
+            bind = self._session_bind = (session, getattr(session, "session_id", None), send)
+        return bind
 
-    def _make_serializable(self, value: Any) -> Any:
-        if value is None or isinstance(value, (str, int, float, bool)):
-            return value
-        if is_dataclass(value):
-            return asdict(value)
-        if isinstance(value, dict):
-            return {k: self._make_serializable(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple, set)):
-            return [self._make_serializable(v) for v in value]
-        if hasattr(value, "dict"):
+    async def _send_ws_event(self, session: Any, ws_event: dict[str, Any]) -> None:
+        await self._bind_session(session)[2](ws_event)
+
+    async def _flush_events(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        """Send queued events, coalescing bursts into pipeline.batch messages.
+
+        A ``None`` item flushes whatever is pending and stops the loop.
+        Items are marked done once sent, so ``queue.join()`` waits for
+        everything emitted so far to go out.
+        """
+        interval = self.event_flush_interval_ms / 1000
+        done = False
+        while not done:
+            first = await queue.get()
+            if first is None:
+                queue.task_done()
+                return
+            if interval:
+                # Give the rest of the burst a chance to arrive
+                await asyncio.sleep(interval)
+            batch = [first]
+            taken = 1
+            while len(batch) < self.event_batch_size and not queue.empty():
+                item = queue.get_nowait()
+                taken += 1
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            session = get_ws_session_context()
             try:
-                return value.dict()
-            except Exception:  # pragma: no cover - best effort
-                pass
-        if hasattr(value, "__dict__"):
-            return {
-                k: self._make_serializable(v)
-                for k, v in vars(value).items()
-                if not k.startswith("_")
-            }
-        return str(value)
+                if not session:
+                    continue
+                if len(batch) == 1:
+                    await self._send_ws_event(session, batch[0])
+                else:
+                    event_type = self._event_type(PipelineEvents.BATCH)
+                    _, session_id, send = self._bind_session(session)
+                    await send(
+                        create_event(event_type, session_id=session_id, content={"events": batch})
+                    )
+                if self.reference_tasks:
+                    for ws_event in batch:
+                        self._mark_tasks_sent(ws_event.get("content"))
+            except Exception as exc:  # pragma: no cover - safeguard
+                logger.debug("Failed to flush {} queued events: {}", len(batch), exc)
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
+
+    async def _send_now(self, session: Any, ws_event: dict[str, Any]) -> None:
+        """Send an event right away, after any events still queued for batching."""
+        if self._emit_queue is not None:
+            await self._emit_queue.join()
+        await self._send_ws_event(session, ws_event)
+
+    def _make_serializable(self, value: Any) -> Any:
+        return _make_serializable(value)
+
+    def _serialize_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Serialize a progress payload, converting each task once per run.
+
+        The same task objects appear in plan.completed and in every solver
+        event for them, so their converted form is reused by identity.
+        """
+        if self.defer_serialization:
+            # Copied so reshaping metadata below leaves the pipeline's dict alone
+            content = dict(payload)
+            if self.reference_tasks and isinstance(content.get("tasks"), (list, tuple)):
+                content.update(self._task_list_fields(content.pop("tasks")))
+            return content
+        if "task" not in payload and "tasks" not in payload:
+            return self._make_serializable(payload)
+        content: dict[str, Any] = {}
+        for key, value in payload.items():
+            if key == "task":
+                content[key] = self._serialize_task(value)
+            elif key == "tasks" and isinstance(value, (list, tuple)):
+                content.update(self._task_list_fields(value))
+            else:
+                content[key] = self._make_serializable(value)
+        return content
+
+    def _task_list_fields(self, tasks: Sequence[Any], *, full: bool = False) -> dict[str, Any]:
+        """Return the event fields for a task list.
+
+        With ``reference_tasks`` the list is identified by a digest of its
+        serialized form, and the tasks themselves are left out once an event
+        carrying them under that digest has been sent (see
+        ``_mark_tasks_sent``), unless ``full`` is set.
+        """
+        serialized = [self._serialize_task(task) for task in tasks]
+        if not self.reference_tasks:
+            return {"tasks": serialized}
+        digest = hashlib.blake2b(dumps_event(serialized).encode(), digest_size=8).hexdigest()
+        if not full and digest in self._sent_task_refs:
+            return {"tasks_ref": digest}
+        return {"tasks": serialized, "tasks_ref": digest}
+
+    def _mark_tasks_sent(self, fields: Any) -> None:
+        """Record the digest of a full task list that has gone out."""
+        if isinstance(fields, dict) and "tasks" in fields:
+            digest = fields.get("tasks_ref")
+            if digest is not None:
+                self._sent_task_refs.add(digest)
+
+    def _serialize_task(self, task: Any) -> Any:
+        if type(task) in _PRIMITIVE_TYPES:
+            return task
+        cached = self._serialized_tasks.get(id(task))
+        if cached is None or cached[0] is not task:
+            cached = self._serialized_tasks[id(task)] = (task, self._make_serializable(task))
+        return cached[1]
 
     async def _await_plan_confirmation(self, context: PlanContext) -> tuple[list[Any] | None, bool]:
         """Send a plan confirmation request and wait for user's response.
@@ -910,8 +1916,10 @@ class PlanSolverSessionAgent(BaseAgent):
         step_id = f"confirm_plan_{uuid.uuid4().hex[:8]}"
         self._last_plan_confirm_step_id = step_id
 
-        # Emit a user confirmation request with full tasks as metadata
+        # Emit a user confirmation request with full tasks as metadata; the
+        # list is always included since this is where the user edits it
         try:
+            task_fields = self._task_list_fields(context.tasks, full=True)
             ws_event = create_event(
                 AgentEvents.USER_CONFIRM,
                 session_id=getattr(session, "session_id", None),
@@ -921,13 +1929,11 @@ class PlanSolverSessionAgent(BaseAgent):
                     "requires_confirmation": True,
                     "scope": "plan",
                     "plan_summary": context.plan_summary,
-                    "tasks": self._make_serializable(list(context.tasks)),
+                    **task_fields,
                 },
             )
-            if hasattr(session, "_send_event"):
-                await session._send_event(ws_event)  # type: ignore[attr-defined]
-            else:
-                await send_websocket_message(session.websocket, ws_event)  # type: ignore[attr-defined]
+            await self._send_now(session, ws_event)
+            self._mark_tasks_sent(task_fields)
         except Exception:
             # Best effort: in case event emission fails, proceed
             return None, True
@@ -980,9 +1986,11 @@ class PlanSolverSessionAgent(BaseAgent):
         if self.state not in (AgentState.IDLE, AgentState.FINISHED):
             raise RuntimeError(f"Cannot run agent from state: {self.state}")
 
+        self._serialized_tasks.clear()
+        self._sent_task_refs.clear()
         # Coerce tasks to the planner's expected type if supported
         try:
-            coerced_tasks = list(self.pipeline.planner.coerce_tasks(raw_tasks))
+            coerced_tasks = tuple(self.pipeline.planner.coerce_tasks(raw_tasks))
         except Exception as exc:
             await self._emit_event(
                 PlanEvents.COERCION_ERROR,
@@ -1015,13 +2023,6 @@ class PlanSolverSessionAgent(BaseAgent):
             # Run solvers only; do not aggregate or emit pipeline-level events
             results = await self.pipeline._run_solvers(coerced_tasks, context)  # type: ignore[attr-defined]
 
-            # Cache for potential restart support
-            self._last_context = context
-            try:
-                self._last_solver_results = list(result.solver_results)
-            except Exception:
-                self._last_solver_results = []
-
             # Cache last context and results (for potential restarts)
             self._last_context = context
             try:
@@ -1071,6 +2072,16 @@ class PlanSolverSessionAgent(BaseAgent):
         except Exception:
             return False
 
+    def _task_index_for(self, context: PlanContext) -> dict[str, Any]:
+        """Map each task id (as str) to its first task, built once per context."""
+        index = self._task_index
+        if index is None or index[0] is not context:
+            by_id: dict[str, Any] = {}
+            for task in context.tasks:
+                by_id.setdefault(str(_task_id(task)), task)
+            index = self._task_index = (context, by_id)
+        return index[1]
+
     async def restart_solver_task(self, task_id: int | str) -> bool:
         # Case 1: during solving, delegate to pipeline's in-run restart
         if self._solving_started:
@@ -1084,19 +2095,7 @@ class PlanSolverSessionAgent(BaseAgent):
         if not context:
             return False
 
-        def _tid(x: Any) -> Any:
-            try:
-                if isinstance(x, dict):
-                    return x.get("id")
-                return getattr(x, "id", None)
-            except Exception:
-                return None
-
-        target_task = None
-        for t in context.tasks:
-            if _tid(t) == task_id or str(_tid(t)) == str(task_id):
-                target_task = t
-                break
+        target_task = self._task_index_for(context).get(str(task_id))
         if target_task is None:
             return False
 
@@ -1119,7 +2118,7 @@ class PlanSolverSessionAgent(BaseAgent):
         updated_results: list[SolverRunResult] = []
         replaced = False
         for r in getattr(self, "_last_solver_results", []) or []:
-            if _tid(r.task) == _tid(target_task):
+            if _task_id(r.task) == _task_id(target_task):
                 updated_results.append(new_res)
                 replaced = True
             else:
@@ -1146,6 +2145,7 @@ def create_plan_solver_session_agent(
     retry_delay_seconds: float = 0.0,
     require_plan_confirmation: bool = False,
     plan_confirmation_timeout: int = 300,
+    subscribed_events: set[str] | None = None,
 ) -> PlanSolverSessionAgent:
     """Factory to wrap a PlanSolverPipeline for WebSocket usage.
 
@@ -1156,6 +2156,7 @@ def create_plan_solver_session_agent(
         broadcast_tasks: Whether to include full task payloads in events.
         max_retry_attempts: Number of retries allowed when execution fails.
         retry_delay_seconds: Delay between retries emitted by the session layer.
+        subscribed_events: Pipeline progress events to forward; None forwards all.
     """
 
     agent_name = name or pipeline.name
@@ -1170,4 +2171,5 @@ def create_plan_solver_session_agent(
         retry_delay_seconds=retry_delay_seconds,
         require_plan_confirmation=require_plan_confirmation,
         plan_confirmation_timeout=plan_confirmation_timeout,
+        subscribed_events=subscribed_events,
     )
@@ -39,10 +39,13 @@ class AgentWebSocketServer:
         host: str = "localhost",
         port: int = 8080,
         state_secret_key: str | None = None,
+        binary_frames: bool = False,
     ):
         self.agent_factory_func = agent_factory_func
         self.host = host
         self.port = port
+        # Events go out as binary frames of UTF-8 JSON; clients must decode them
+        self.binary_frames = binary_frames
         self.sessions: dict[str, AgentSession] = {}
         self.connections: dict[str, WebSocketServerProtocol] = {}
         self.outbounds: dict[str, OutboundChannel] = {}
@@ -83,7 +86,9 @@ class AgentWebSocketServer:
         logger.info(f"New WebSocket connection: {connection_id}")
 
         # Create per-connection outbound channel (single-writer)
-        outbound = OutboundChannel(websocket, name=f"conn-{connection_id}")
+        outbound = OutboundChannel(
+            websocket, name=f"conn-{connection_id}", binary=self.binary_frames
+        )
         outbound.start()
         self.outbounds[connection_id] = outbound
         # Initialize sequence tracking and buffers
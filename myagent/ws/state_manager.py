@@ -215,8 +215,16 @@ class StateManager:
         """Serialize agent memory to JSON string."""
         try:
             if hasattr(agent, 'memory') and hasattr(agent.memory, 'messages'):
+                # Limit history size to prevent large states; cut before
+                # converting so dropped messages are never serialized
+                max_messages = 100
+                history = agent.memory.messages
+                if len(history) > max_messages:
+                    history = history[-max_messages:]
+                    logger.info(f"Truncated message history to {max_messages} messages")
+
                 messages = []
-                for msg in agent.memory.messages:
+                for msg in history:
                     # Convert message to serializable format
                     serializable_msg = {
                         "role": getattr(msg, 'role', 'unknown'),
@@ -229,12 +237,6 @@ class StateManager:
                     serializable_msg = {k: v for k, v in serializable_msg.items() if v is not None}
                     messages.append(serializable_msg)
                 
-                # Limit history size to prevent large states
-                max_messages = 100
-                if len(messages) > max_messages:
-                    messages = messages[-max_messages:]
-                    logger.info(f"Truncated message history to {max_messages} messages")
-                
                 return json.dumps(messages, ensure_ascii=False)
             return "[]"
         except Exception as e:
@@ -1,12 +1,94 @@
 """WebSocket utility functions for cross-version compatibility."""
 
 import json
+from dataclasses import asdict
+from dataclasses import is_dataclass
+from datetime import date
+from datetime import datetime
+from datetime import time
+from enum import Enum
 from typing import Any
+from uuid import UUID
 
 from websockets.server import WebSocketServerProtocol
 
 from myagent.logger import logger
 
+try:  # Optional C JSON encoder, installed with the "fast" extra
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _encode_default(value: Any) -> Any:
+    """Convert objects the JSON encoders do not handle natively.
+
+    Covers what event payloads may still carry when they are not converted
+    to builtins up front: dataclasses, datetimes, UUIDs and enums (which
+    orjson encodes itself, so the json fallback matches it), pydantic
+    models and sets. Anything else raises TypeError, as json.dumps does.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict"):
+        return value.dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(message: dict[str, Any]) -> str:
+    # Same output as orjson: compact separators and raw UTF-8, not \u escapes
+    return json.dumps(
+        message, default=_encode_default, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def dumps_event(message: dict[str, Any]) -> str:
+    """Encode an event as JSON text, using orjson when it is installed.
+
+    Non-ASCII characters are emitted as UTF-8 rather than \\u escapes, which
+    orjson cannot produce; clients decode the same strings either way.
+    Falls back to json.dumps for payloads orjson rejects (e.g., integers
+    beyond 64 bits), with identical output. Unsupported types raise
+    TypeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                message, default=_encode_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+    return _json_dumps(message)
+
+
+def encode_event(message: dict[str, Any], *, binary: bool = False) -> str | bytes:
+    """Encode an event for websocket.send().
+
+    Text frames get a str, as from dumps_event. Binary frames get UTF-8 JSON
+    bytes, taken straight from orjson when it is installed, which skips the
+    decode and the receiver's UTF-8 validation of text frames.
+    """
+    if not binary:
+        return dumps_event(message)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                message, default=_encode_default, option=orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return _json_dumps(message).encode()
+
 
 def is_websocket_closed(websocket: WebSocketServerProtocol) -> bool:
     """Check if a WebSocket connection is closed in a version-compatible way.
@@ -43,7 +125,7 @@ async def send_websocket_message(
     """
     try:
         if not is_websocket_closed(websocket):
-            await websocket.send(json.dumps(message))
+            await websocket.send(dumps_event(message))
             return True
         else:
             logger.debug("WebSocket connection is closed, cannot send message")
@@ -0,0 +1 @@
+"""Tests for agent base classes."""
@@ -0,0 +1,79 @@
+"""Unit tests for BaseAgent memory compaction."""
+
+import pytest
+
+from myagent.agent.base import BaseAgent
+from myagent.schema import Function
+from myagent.schema import Memory
+from myagent.schema import Message
+from myagent.schema import ToolCall
+
+
+class _Agent(BaseAgent):
+    async def step(self) -> str:
+        return ""
+
+
+def _make_agent(**fields) -> _Agent:
+    # model_construct skips building a default LLM client
+    return _Agent.model_construct(name="compact", llm=None, memory=Memory(), **fields)
+
+
+def _tool_turn(call_id: str) -> list[Message]:
+    call = ToolCall(id=call_id, function=Function(name="lookup", arguments="{}"))
+    return [
+        Message(role="assistant", tool_calls=[call]),
+        Message.tool_message("ok", name="lookup", tool_call_id=call_id),
+    ]
+
+
+def _assert_tool_calls_answered(messages: list[Message]) -> None:
+    for i, msg in enumerate(messages):
+        if msg.role == "assistant" and msg.tool_calls:
+            replies = {m.tool_call_id for m in messages[i + 1 :] if m.role == "tool"}
+            assert {c.id for c in msg.tool_calls} <= replies
+        if msg.role == "tool":
+            assert messages[i - 1].role in ("assistant", "tool")
+
+
+@pytest.mark.unit
+class TestCompactMemory:
+    """Test cases for BaseAgent._compact_memory."""
+
+    def test_keeps_prefix_tool_replies(self):
+        agent = _make_agent(memory_window=8)
+        messages = [Message.user_message("question")]
+        for i in range(6):
+            messages.extend(_tool_turn(f"c{i}"))
+        agent.memory.messages = messages
+
+        agent._compact_memory()
+
+        compacted = agent.memory.messages
+        assert len(compacted) < len(messages)
+        assert compacted[:3] == messages[:3]
+        assert compacted[3].content == "[earlier turns omitted]"
+        _assert_tool_calls_answered(compacted)
+
+    def test_tail_never_starts_with_tool_reply(self):
+        agent = _make_agent(memory_window=6, memory_prefix_lock=1)
+        messages = [Message.user_message("question")]
+        for i in range(6):
+            messages.extend(_tool_turn(f"c{i}"))
+        agent.memory.messages = messages
+
+        agent._compact_memory()
+
+        compacted = agent.memory.messages
+        assert compacted[0] is messages[0]
+        assert compacted[2].role == "assistant"
+        _assert_tool_calls_answered(compacted)
+
+    def test_within_window_is_unchanged(self):
+        agent = _make_agent(memory_window=20)
+        messages = [Message.user_message("question"), *_tool_turn("c0")]
+        agent.memory.messages = list(messages)
+
+        agent._compact_memory()
+
+        assert agent.memory.messages == messages
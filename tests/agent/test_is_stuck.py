@@ -0,0 +1,88 @@
+"""Unit tests for BaseAgent.is_stuck."""
+
+import random
+
+import pytest
+
+from myagent.agent.base import BaseAgent
+from myagent.schema import Memory
+from myagent.schema import Message
+
+
+class _Agent(BaseAgent):
+    async def step(self) -> str:
+        return ""
+
+
+def _make_agent(**fields) -> _Agent:
+    # model_construct skips building a default LLM client
+    return _Agent.model_construct(name="stuck", llm=None, **fields)
+
+
+def _full_scan_is_stuck(messages: list[Message], threshold: int) -> bool:
+    """The full-memory scan the incremental counter replaced."""
+    if len(messages) < 2:
+        return False
+    assistant_messages = [
+        msg for msg in messages if msg.role == "assistant" and msg.content
+    ]
+    if len(assistant_messages) < 2:
+        return False
+    last = assistant_messages[-1]
+    duplicate_count = sum(
+        1 for msg in assistant_messages[:-1] if msg.content == last.content
+    )
+    return duplicate_count >= threshold
+
+
+def _random_message(rng: random.Random) -> Message:
+    role = rng.choice(["user", "assistant", "assistant", "tool"])
+    if role == "user":
+        return Message.user_message(rng.choice(["q1", "q2"]))
+    if role == "tool":
+        return Message.tool_message("ok", name="lookup", tool_call_id="c1")
+    return Message.assistant_message(rng.choice(["same", "other", "", None]))
+
+
+@pytest.mark.unit
+class TestIsStuck:
+    """Test cases for BaseAgent.is_stuck."""
+
+    def test_detects_repeated_content(self):
+        """A repeat of earlier assistant content counts as stuck."""
+        agent = _make_agent(memory=Memory())
+        agent.memory.add_messages(
+            [Message.assistant_message("same"), Message.user_message("q")]
+        )
+        assert not agent.is_stuck()
+
+        agent.memory.add_message(Message.assistant_message("same"))
+        assert agent.is_stuck()
+
+        agent.memory.add_message(Message.assistant_message("other"))
+        assert not agent.is_stuck()
+
+    @pytest.mark.parametrize("threshold", [1, 2])
+    def test_matches_full_scan_as_window_slides(self, threshold):
+        """Counts stay equal to a full scan through appends, overflow and compaction."""
+        rng = random.Random(threshold)
+        agent = _make_agent(
+            memory=Memory(max_messages=8),
+            duplicate_threshold=threshold,
+            memory_window=6,
+            memory_prefix_lock=1,
+        )
+        for step in range(300):
+            op = rng.random()
+            if op < 0.7:
+                agent.memory.add_message(_random_message(rng))
+            elif op < 0.8:
+                agent._compact_memory()
+            elif op < 0.9 and agent.memory.messages:
+                # In-place rewrite of the newest message
+                agent.memory.messages[-1] = _random_message(rng)
+            else:
+                agent.memory.messages = agent.memory.messages[rng.randrange(3) :]
+
+            expected = _full_scan_is_stuck(agent.memory.messages, threshold)
+            assert agent.is_stuck() == expected, step
@@ -0,0 +1,80 @@
+"""Unit tests for BaseAgent.run_batch_async."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic import Field
+
+from myagent.agent.toolcall import ToolCallAgent
+from myagent.schema import AgentState
+from myagent.schema import Memory
+from myagent.tool import ToolCollection
+from myagent.tool.base_tool import BaseTool
+from myagent.tool.base_tool import ToolResult
+
+
+class _ProbeTool(BaseTool):
+    """Records each use and cleanup; the log list is shared by its copies."""
+
+    name: str = "probe"
+    description: str = "Sleeps for the given delay."
+    log: list[tuple[Any, ...]] = Field(default_factory=list)
+    closed: bool = False
+
+    async def execute(self, delay: float = 0.0) -> ToolResult:
+        await asyncio.sleep(delay)
+        self.log.append(("execute", id(self), self.closed))
+        return ToolResult(output="ok")
+
+    async def cleanup(self) -> None:
+        self.closed = True
+        self.log.append(("cleanup", id(self)))
+
+
+class _ProbeAgent(ToolCallAgent):
+    async def step(self) -> str:
+        # The request is the delay the probe tool sleeps for
+        delay = float(self.memory.messages[0].content)
+        await self.available_tools.execute(name="probe", tool_input={"delay": delay})
+        self.state = AgentState.FINISHED
+        return f"slept {delay}"
+
+
+def _make_agent(tool: BaseTool) -> _ProbeAgent:
+    # model_construct skips building a default LLM client
+    return _ProbeAgent.model_construct(
+        name="probe", llm=None, memory=Memory(), available_tools=ToolCollection(tool)
+    )
+
+
+@pytest.mark.unit
+class TestRunBatchAsync:
+    """Test cases for BaseAgent.run_batch_async."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Results follow the requests and the agent itself stays untouched."""
+        agent = _make_agent(_ProbeTool())
+
+        results = await agent.run_batch_async(["0.02", "0"], max_concurrency=2)
+
+        assert results == ["Step 1: slept 0.02", "Step 1: slept 0.0"]
+        assert agent.memory.messages == []
+        assert agent.state == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_clone_cleanup_leaves_siblings_tools_alone(self):
+        """A clone finishing first must not clean up tools its siblings use."""
+        tool = _ProbeTool()
+        agent = _make_agent(tool)
+
+        await agent.run_batch_async(["0.05", "0"])
+
+        executes = [entry for entry in tool.log if entry[0] == "execute"]
+        cleanups = [entry[1] for entry in tool.log if entry[0] == "cleanup"]
+        assert len(executes) == 2
+        assert not any(closed for _, _, closed in executes)
+        assert len(set(cleanups)) == 2
+        assert id(tool) not in cleanups
+        assert not tool.closed
@@ -0,0 +1,74 @@
+"""Unit tests for LLM message formatting."""
+
+import pytest
+
+from myagent.llm import LLM
+from myagent.schema import Function
+from myagent.schema import Message
+from myagent.schema import ToolCall
+
+
+def _call_message() -> Message:
+    call = ToolCall(id="c1", function=Function(name="lookup", arguments="{}"))
+    return Message(role="assistant", content="calling", tool_calls=[call])
+
+
+@pytest.mark.unit
+class TestFormatMessages:
+    """Test cases for LLM.format_messages and its per-message cache."""
+
+    def test_repeated_calls_reuse_cached_dict(self, monkeypatch):
+        """A message is converted once per image mode."""
+        msg = Message.user_message("hi")
+        calls = []
+        original = LLM._format_message_dict
+
+        def counting(message, supports_images):
+            calls.append(supports_images)
+            return original(message, supports_images)
+
+        monkeypatch.setattr(LLM, "_format_message_dict", staticmethod(counting))
+
+        first = LLM.format_messages([msg])
+        second = LLM.format_messages([msg])
+        LLM.format_messages([msg], supports_images=True)
+
+        assert first == second == [{"role": "user", "content": "hi"}]
+        assert calls == [False, True]
+
+    def test_field_assignment_invalidates(self):
+        """Reassigning a field rebuilds the payload."""
+        msg = Message.user_message("hi")
+        LLM.format_messages([msg])
+
+        msg.content = "bye"
+
+        assert LLM.format_messages([msg]) == [{"role": "user", "content": "bye"}]
+
+    def test_nested_tool_call_edit_invalidates(self):
+        """In-place edits of a tool call are picked up."""
+        msg = _call_message()
+        LLM.format_messages([msg])
+
+        msg.tool_calls[0].function.arguments = '{"q": 1}'
+        msg.tool_calls.append(
+            ToolCall(id="c2", function=Function(name="lookup", arguments="{}"))
+        )
+
+        (formatted,) = LLM.format_messages([msg])
+        assert formatted["tool_calls"][0]["function"]["arguments"] == '{"q": 1}'
+        assert [call["id"] for call in formatted["tool_calls"]] == ["c1", "c2"]
+
+    def test_returned_dicts_do_not_alias_cache(self):
+        """Edits to a returned payload, nested ones included, do not leak."""
+        msg = Message.user_message("look", base64_image="aGk=")
+        (first,) = LLM.format_messages([msg], supports_images=True)
+
+        first["injected"] = True
+        first["content"].append({"type": "text", "text": "extra"})
+        first["content"][0]["text"] = "changed"
+
+        (second,) = LLM.format_messages([msg], supports_images=True)
+        assert "injected" not in second
+        assert [part["type"] for part in second["content"]] == ["text", "image_url"]
+        assert second["content"][0]["text"] == "look"
@@ -0,0 +1,135 @@
+"""Unit tests for the LLM call logger and its sampling setting."""
+
+import json
+import threading
+
+import pytest
+
+from myagent import llm_logger
+from myagent.config import _sample_rate_from_env
+from myagent.llm_logger import LLMCallLogger
+
+
+def _log(call_logger: LLMCallLogger, model: str = "m") -> None:
+    call_logger.log_llm_call(model, [{"role": "user", "content": "hi"}], "ok")
+
+
+def _models_on_disk(call_logger: LLMCallLogger) -> list[str]:
+    with open(call_logger.log_file_path, encoding="utf-8") as f:
+        return [record["model"] for record in json.load(f)]
+
+
+@pytest.mark.unit
+class TestBatchedWrites:
+    """Test cases for buffering and the background writer."""
+
+    def test_full_batch_is_written_on_writer_thread(self, tmp_path, monkeypatch):
+        """Records wait for a full batch, then a writer thread appends them."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"), batch_size=2)
+        threads = []
+        original = LLMCallLogger._append_to_log_file
+
+        def recording(self, records):
+            threads.append(threading.current_thread())
+            original(self, records)
+
+        monkeypatch.setattr(LLMCallLogger, "_append_to_log_file", recording)
+
+        _log(call_logger, "a")
+        assert len(call_logger._pending) == 1
+        assert _models_on_disk(call_logger) == []
+
+        _log(call_logger, "b")
+        _log(call_logger, "c")
+        call_logger._writer.submit(lambda: None).result()
+
+        assert _models_on_disk(call_logger) == ["a", "b"]
+        assert threads and all(t is not threading.main_thread() for t in threads)
+
+        call_logger.flush()
+        assert _models_on_disk(call_logger) == ["a", "b", "c"]
+
+    def test_schedule_flush_without_records(self, tmp_path):
+        """Nothing buffered means nothing is scheduled."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"))
+
+        assert call_logger.schedule_flush() is None
+        assert call_logger._writer is None
+
+    def test_writes_inline_after_writer_shutdown(self, tmp_path):
+        """Once the writer refuses work, flush writes on the calling thread."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"), batch_size=1)
+        _log(call_logger, "a")
+        call_logger._writer.shutdown(wait=True)
+
+        _log(call_logger, "b")
+        call_logger.flush()
+
+        assert _models_on_disk(call_logger) == ["a", "b"]
+
+    def test_readers_see_buffered_records(self, tmp_path):
+        """Statistics and recent calls flush the buffer first."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"))
+        _log(call_logger, "a")
+
+        assert call_logger.get_statistics()["total_calls"] == 1
+        assert [r["model"] for r in call_logger.get_recent_calls()] == ["a"]
+
+
+@pytest.mark.unit
+class TestSampling:
+    """Test cases for head sampling of logged calls."""
+
+    def test_zero_rate_records_nothing(self, tmp_path):
+        """Unsampled calls never reach the buffer."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"), sample_rate=0.0)
+        _log(call_logger)
+        call_logger.flush()
+
+        assert call_logger._pending == []
+        assert _models_on_disk(call_logger) == []
+
+    def test_partial_rate_uses_random_draw(self, tmp_path, monkeypatch):
+        """A call is kept when the draw falls below the rate."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"), sample_rate=0.5)
+        draws = iter([0.2, 0.7])
+        monkeypatch.setattr(llm_logger.random, "random", lambda: next(draws))
+
+        _log(call_logger, "kept")
+        _log(call_logger, "dropped")
+        call_logger.flush()
+
+        assert _models_on_disk(call_logger) == ["kept"]
+
+    @pytest.mark.parametrize(("rate", "expected"), [(-1, 0.0), (2, 1.0)])
+    def test_rate_is_clamped(self, tmp_path, rate, expected):
+        """Out-of-range rates are clamped to [0, 1]."""
+        call_logger = LLMCallLogger(str(tmp_path / "calls.json"), sample_rate=rate)
+
+        assert call_logger.sample_rate == expected
+
+
+@pytest.mark.unit
+class TestSampleRateFromEnv:
+    """Test cases for parsing LLM_LOG_SAMPLE_RATE."""
+
+    def test_unset_uses_default(self, monkeypatch):
+        """A missing variable yields the default."""
+        monkeypatch.delenv("LLM_LOG_SAMPLE_RATE", raising=False)
+
+        assert _sample_rate_from_env("LLM_LOG_SAMPLE_RATE") == 1.0
+
+    @pytest.mark.parametrize(("raw", "expected"), [("0.25", 0.25), ("5", 1.0)])
+    def test_parses_and_clamps(self, monkeypatch, raw, expected):
+        """Numeric values are parsed and clamped."""
+        monkeypatch.setenv("LLM_LOG_SAMPLE_RATE", raw)
+
+        assert _sample_rate_from_env("LLM_LOG_SAMPLE_RATE") == expected
+
+    @pytest.mark.parametrize("raw", ["half", "nan", "inf"])
+    def test_invalid_falls_back_with_warning(self, monkeypatch, raw):
+        """Malformed values warn and use the default instead of raising."""
+        monkeypatch.setenv("LLM_LOG_SAMPLE_RATE", raw)
+
+        with pytest.warns(UserWarning, match="LLM_LOG_SAMPLE_RATE"):
+            assert _sample_rate_from_env("LLM_LOG_SAMPLE_RATE", 0.5) == 0.5
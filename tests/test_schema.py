@@ -0,0 +1,315 @@
+"""Unit tests for messages and memory."""
+
+import random
+
+import pytest
+
+from myagent.schema import Function
+from myagent.schema import Memory
+from myagent.schema import Message
+from myagent.schema import ToolCall
+
+
+def _call(call_id: str) -> ToolCall:
+    return ToolCall(id=call_id, function=Function(name="lookup", arguments="{}"))
+
+
+@pytest.mark.unit
+class TestToDictList:
+    """Test cases for Memory.to_dict_list and its per-message cache."""
+
+    def test_repeated_snapshots_reuse_cached_dict(self, monkeypatch):
+        """Unchanged messages are converted once."""
+        memory = Memory(messages=[Message.user_message("hi")])
+        calls = []
+        original = Message.to_dict
+
+        def counting(self):
+            calls.append(self.content)
+            return original(self)
+
+        monkeypatch.setattr(Message, "to_dict", counting)
+
+        first = memory.to_dict_list()
+        memory.add_message(Message.assistant_message("hello"))
+        second = memory.to_dict_list()
+
+        assert first == second[:1] == [{"role": "user", "content": "hi"}]
+        assert calls == ["hi", "hello"]
+
+    def test_field_assignment_invalidates(self):
+        """Reassigning a field shows up in the next snapshot."""
+        msg = Message.user_message("hi")
+        memory = Memory(messages=[msg])
+        memory.to_dict_list()
+
+        msg.content = "bye"
+
+        assert memory.to_dict_list() == [{"role": "user", "content": "bye"}]
+
+    def test_nested_tool_call_edit_invalidates(self):
+        """In-place edits of a tool call show up in the next snapshot."""
+        msg = Message(role="assistant", tool_calls=[_call("c1")])
+        memory = Memory(messages=[msg])
+        memory.to_dict_list()
+
+        msg.tool_calls[0].function.arguments = '{"q": 1}'
+
+        (data,) = memory.to_dict_list()
+        assert data["tool_calls"][0]["function"]["arguments"] == '{"q": 1}'
+
+    def test_returned_dicts_do_not_alias_cache(self):
+        """Edits to a snapshot, nested ones included, do not leak."""
+        memory = Memory(messages=[Message(role="assistant", tool_calls=[_call("c1")])])
+        (first,) = memory.to_dict_list()
+
+        first["injected"] = True
+        first["tool_calls"][0]["function"]["name"] = "changed"
+
+        (second,) = memory.to_dict_list()
+        assert "injected" not in second
+        assert second["tool_calls"][0]["function"]["name"] == "lookup"
+
+
+@pytest.mark.unit
+class TestLastAssistantContent:
+    """Test cases for Memory.last_assistant_content's tracked index."""
+
+    def test_follows_appends(self):
+        """Appended messages update the index; empty assistant turns are skipped."""
+        memory = Memory()
+        memory.add_message(Message.user_message("q"))
+        assert memory.last_assistant_content() is None
+
+        memory.add_messages(
+            [Message.assistant_message("a1"), Message(role="assistant", content="")]
+        )
+        assert memory.last_assistant_content() == "a1"
+
+        memory.add_message(Message.assistant_message("a2"))
+        assert memory.last_assistant_content() == "a2"
+
+    def test_follows_truncation(self):
+        """max_messages overflow and slicing shift or drop the indexed message."""
+        memory = Memory(max_messages=3)
+        memory.add_messages(
+            [Message.assistant_message("a1"), Message.user_message("q1")]
+        )
+        assert memory.last_assistant_content() == "a1"
+
+        memory.add_messages([Message.user_message("q2"), Message.user_message("q3")])
+        assert memory.last_assistant_content() is None
+
+        memory.add_messages(
+            [Message.assistant_message("a2"), Message.user_message("q4")]
+        )
+        memory.messages = memory.messages[:1]
+        assert memory.last_assistant_content() is None
+
+    def test_follows_in_place_replacement(self):
+        """Replacing the list's contents in place is picked up."""
+        memory = Memory()
+        memory.add_messages(
+            [
+                Message.user_message("q"),
+                Message.assistant_message("a1"),
+                Message.user_message("q2"),
+            ]
+        )
+        assert memory.last_assistant_content() == "a1"
+
+        memory.messages[:] = [
+            Message.user_message("x"),
+            Message.assistant_message("old"),
+            Message.assistant_message("new"),
+        ]
+        assert memory.last_assistant_content() == "new"
+
+        memory.messages.append(Message.assistant_message("direct"))
+        assert memory.last_assistant_content() == "direct"
+
+    def test_clear(self):
+        """clear() empties the index and later appends are tracked again."""
+        memory = Memory()
+        memory.add_message(Message.assistant_message("a1"))
+        memory.clear()
+        assert memory.last_assistant_content() is None
+
+        memory.add_message(Message.assistant_message("a2"))
+        assert memory.last_assistant_content() == "a2"
+
+
+@pytest.mark.unit
+class TestLastMessage:
+    """Test cases for Memory.last_message's per-role index."""
+
+    def test_follows_appends(self):
+        """Each role resolves to its latest message."""
+        memory = Memory()
+        user, assistant = Message.user_message("q"), Message.assistant_message("a")
+        tool = Message.tool_message("ok", name="lookup", tool_call_id="c1")
+        memory.add_message(user)
+        memory.add_messages([assistant, tool])
+
+        assert memory.last_message("user") is user
+        assert memory.last_message("assistant") is assistant
+        assert memory.last_message("tool") is tool
+        assert memory.last_message("system") is None
+
+    def test_follows_truncation(self):
+        """Overflow and slicing drop roles that are no longer present."""
+        memory = Memory(max_messages=2)
+        memory.add_messages([Message.user_message("q"), Message.assistant_message("a")])
+        memory.add_message(Message.assistant_message("b"))
+        assert memory.last_message("user") is None
+        assert memory.last_message("assistant").content == "b"
+
+        memory.messages = memory.messages[:1]
+        assert memory.last_message("assistant").content == "a"
+
+    def test_follows_in_place_replacement(self):
+        """Replacing the list's contents in place is picked up."""
+        memory = Memory()
+        memory.add_messages(
+            [Message.user_message("q1"), Message.assistant_message("a")]
+        )
+        assert memory.last_message("user").content == "q1"
+
+        memory.messages[-1] = Message.user_message("q2")
+        assert memory.last_message("user").content == "q2"
+
+        memory.messages[:] = [Message.user_message("x"), Message.user_message("y")]
+        assert memory.last_message("user").content == "y"
+        assert memory.last_message("assistant") is None
+
+    def test_clear(self):
+        """clear() forgets every role."""
+        memory = Memory()
+        memory.add_messages([Message.user_message("q"), Message.assistant_message("a")])
+        memory.clear()
+
+        assert memory.last_message("user") is None
+        memory.add_message(Message.user_message("q2"))
+        assert memory.last_message("user").content == "q2"
+
+
+def _calls_message(*call_ids: str) -> Message:
+    return Message(role="assistant", tool_calls=[_call(i) for i in call_ids])
+
+
+def _reply(call_id: str) -> Message:
+    return Message.tool_message("ok", name="lookup", tool_call_id=call_id)
+
+
+def _nested_scan_valid_ids(messages: list[Message]) -> set[str]:
+    """Complete-chain ids as found by the nested scan the sweep replaced."""
+    valid = set()
+    for i, msg in enumerate(messages):
+        if msg.role == "assistant" and msg.tool_calls:
+            ids = {tc.id for tc in msg.tool_calls}
+            found = set()
+            for later in messages[i + 1 :]:
+                if later.role == "tool" and later.tool_call_id in ids:
+                    found.add(later.tool_call_id)
+                elif later.role in ("assistant", "user"):
+                    break
+            if found == ids:
+                valid.update(ids)
+    return valid
+
+
+def _nested_scan_clean(messages: list[Message]) -> list[Message]:
+    valid = _nested_scan_valid_ids(messages)
+    kept = []
+    for msg in messages:
+        if msg.role == "tool":
+            if msg.tool_call_id in valid:
+                kept.append(msg)
+        elif msg.role == "assistant" and msg.tool_calls:
+            if {tc.id for tc in msg.tool_calls} <= valid:
+                kept.append(msg)
+        else:
+            kept.append(msg)
+    return kept
+
+
+@pytest.mark.unit
+class TestCleanIncompleteToolCalls:
+    """Test cases for Memory.clean_incomplete_tool_calls."""
+
+    def test_keeps_complete_chains(self):
+        """Fully answered calls and ordinary messages are kept."""
+        messages = [
+            Message.user_message("q"),
+            _calls_message("c1", "c2"),
+            _reply("c1"),
+            _reply("c2"),
+            Message.assistant_message("done"),
+        ]
+        memory = Memory(messages=list(messages))
+
+        memory.clean_incomplete_tool_calls()
+
+        assert memory.messages == messages
+
+    def test_drops_orphan_tool_replies(self):
+        """Replies without a preceding call are removed."""
+        memory = Memory(messages=[Message.user_message("q"), _reply("c9")])
+
+        memory.clean_incomplete_tool_calls()
+
+        assert [m.role for m in memory.messages] == ["user"]
+
+    def test_drops_partially_answered_chain(self):
+        """A call missing one of its replies is removed with its replies."""
+        memory = Memory(
+            messages=[
+                Message.user_message("q"),
+                _calls_message("c1", "c2"),
+                _reply("c1"),
+                Message.assistant_message("next"),
+            ]
+        )
+
+        memory.clean_incomplete_tool_calls()
+
+        assert [m.content for m in memory.messages] == ["q", "next"]
+
+    def test_user_message_interrupts_chain(self):
+        """Replies arriving after a user message do not complete the chain."""
+        memory = Memory(
+            messages=[
+                _calls_message("c1"),
+                Message.user_message("interrupt"),
+                _reply("c1"),
+                _calls_message("c2"),
+                _reply("c2"),
+            ]
+        )
+
+        memory.clean_incomplete_tool_calls()
+
+        assert [m.role for m in memory.messages] == ["user", "assistant", "tool"]
+        assert memory.messages[1].tool_calls[0].id == "c2"
+
+    def test_matches_nested_scan(self):
+        """The single sweep agrees with the nested scan on random histories."""
+        rng = random.Random(0)
+        for _ in range(300):
+            messages = []
+            for _ in range(rng.randrange(1, 10)):
+                kind = rng.random()
+                if kind < 0.3:
+                    ids = rng.sample(["c1", "c2", "c3"], rng.randrange(1, 3))
+                    messages.append(_calls_message(*ids))
+                elif kind < 0.7:
+                    messages.append(_reply(rng.choice(["c1", "c2", "c3"])))
+                elif kind < 0.85:
+                    messages.append(Message.user_message("q"))
+                else:
+                    messages.append(Message.assistant_message("a"))
+            memory = Memory(messages=list(messages))
+
+            memory.clean_incomplete_tool_calls()
+
+            assert memory.messages == _nested_scan_clean(messages)
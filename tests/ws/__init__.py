@@ -0,0 +1 @@
+"""Tests for WebSocket plan/solve orchestration."""
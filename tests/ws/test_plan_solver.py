@@ -0,0 +1,688 @@
+"""Unit tests for PlanSolverPipeline."""
+
+import asyncio
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import is_dataclass
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+
+from myagent.agent.toolcall import ToolCallAgent
+from myagent.schema import AgentState
+from myagent.schema import Memory
+from myagent.tool import ToolCollection
+from myagent.tool.base_tool import BaseTool
+from myagent.tool.base_tool import ToolResult
+from myagent.ws.events import PlanEvents
+from myagent.ws.events import SolverEvents
+from myagent.ws.plan_solver import PlanAgent
+from myagent.ws.plan_solver import PlanCache
+from myagent.ws.plan_solver import PlanContext
+from myagent.ws.plan_solver import PlanSolverPipeline
+from myagent.ws.plan_solver import SolverAgent
+from myagent.ws.plan_solver import _make_serializable
+
+
+class _FakeAgent:
+    """Stands in for a BaseAgent; delegates run() to its owner."""
+
+    def __init__(self, owner: Any, task: Any = None) -> None:
+        self.owner = owner
+        self.task = task
+        self.name = f"{owner.name}_agent"
+        self.final_response = None
+
+    async def run(self, request: str) -> str:
+        return await self.owner.run_agent(self.task, request)
+
+
+class _FakePlanner(PlanAgent):
+    def __init__(self, tasks: list[dict[str, Any]]) -> None:
+        super().__init__("fake_planner")
+        self.tasks = tasks
+        self.requests: list[str] = []
+
+    def build_agent(self) -> _FakeAgent:
+        return _FakeAgent(self)
+
+    async def run_agent(self, task: Any, request: str) -> str:
+        self.requests.append(request)
+        return "plan"
+
+    def extract_tasks(self, agent: Any, plan_output: str) -> list[dict[str, Any]]:
+        return self.tasks
+
+
+class _FakeSolver(SolverAgent):
+    """Records every solve; gated tasks block their first attempt until released."""
+
+    def __init__(
+        self, *, gated: tuple[Any, ...] = (), failing: tuple[Any, ...] = ()
+    ) -> None:
+        super().__init__("fake_solver")
+        self.gates = {task_id: asyncio.Event() for task_id in gated}
+        self.failing = set(failing)
+        self.attempts: dict[Any, int] = {}
+        self.log: list[tuple[str, Any]] = []
+
+    def build_agent(self, task: Any, *, context: PlanContext) -> _FakeAgent:
+        return _FakeAgent(self, task)
+
+    def build_request(self, task: Any, *, context: PlanContext) -> str:
+        return str(task.get("request", task["id"]))
+
+    def extract_result(
+        self, agent: Any, solver_output: str, task: Any, *, context: PlanContext
+    ) -> str:
+        return solver_output
+
+    async def run_agent(self, task: Any, request: str) -> str:
+        task_id = task["id"]
+        attempt = self.attempts[task_id] = self.attempts.get(task_id, 0) + 1
+        self.log.append(("start", task_id))
+        gate = self.gates.get(task_id)
+        if gate is not None and attempt == 1:
+            await gate.wait()
+        else:
+            await asyncio.sleep(0)
+        if task_id in self.failing:
+            raise ValueError(f"task {task_id} failed")
+        self.log.append(("end", task_id))
+        return f"out:{request}"
+
+    def release(self, task_id: Any) -> None:
+        self.gates[task_id].set()
+
+
+class _EventLog:
+    """Progress callback collecting (event, payload) pairs."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    async def __call__(self, event: str, payload: dict[str, Any]) -> None:
+        self.events.append((event, payload))
+
+    def task_ids(self, event: str) -> list[Any]:
+        return [payload["task"]["id"] for name, payload in self.events if name == event]
+
+
+def _context(tasks: list[dict[str, Any]]) -> PlanContext:
+    return PlanContext(
+        name="test",
+        question="question",
+        tasks=tuple(tasks),
+        plan_summary=None,
+        raw_plan_output=None,
+    )
+
+
+def _pipeline(
+    solver: SolverAgent, events: _EventLog | None = None, **kwargs
+) -> PlanSolverPipeline:
+    return PlanSolverPipeline(
+        planner=kwargs.pop("planner", PlanAgent()),
+        solver=solver,
+        progress_callback=events,
+        **kwargs,
+    )
+
+
+async def _until(condition, *, steps: int = 1000) -> None:
+    for _ in range(steps):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.unit
+class TestTaskControl:
+    """Test cases for per-task cancel and restart requests."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_task(self):
+        """A queued task cancelled before it starts never runs."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("a",))
+        events = _EventLog()
+        pipeline = _pipeline(solver, events, concurrency=1)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", "a") in solver.log)
+
+        assert await pipeline.request_cancel_solver_task("b")
+        solver.release("a")
+        results = await run
+
+        assert [r.task["id"] for r in results] == ["a"]
+        assert ("start", "b") not in solver.log
+        assert events.task_ids(SolverEvents.CANCELLED) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_task(self):
+        """Cancelling a running task drops its result and keeps the others."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("a",))
+        events = _EventLog()
+        pipeline = _pipeline(solver, events)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", "a") in solver.log)
+
+        assert await pipeline.request_cancel_solver_task("a")
+        results = await run
+
+        assert [r.task["id"] for r in results] == ["b"]
+        assert ("end", "a") not in solver.log
+        assert events.task_ids(SolverEvents.CANCELLED) == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_restart_queued_task_clears_cancel(self):
+        """Restarting a queued task withdraws an earlier cancel request."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("a",))
+        pipeline = _pipeline(solver, concurrency=1)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", "a") in solver.log)
+
+        assert await pipeline.request_cancel_solver_task("b")
+        assert await pipeline.request_restart_solver_task("b")
+        solver.release("a")
+        results = await run
+
+        assert [r.task["id"] for r in results] == ["a", "b"]
+        assert solver.attempts == {"a": 1, "b": 1}
+
+    @pytest.mark.asyncio
+    async def test_restart_running_task(self):
+        """A running task is cancelled and solved again in place."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("a",))
+        events = _EventLog()
+        pipeline = _pipeline(solver, events)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", "a") in solver.log)
+
+        assert await pipeline.request_restart_solver_task("a")
+        results = await run
+
+        assert [r.task["id"] for r in results] == ["a", "b"]
+        assert solver.attempts["a"] == 2
+        assert events.task_ids(SolverEvents.RESTARTED) == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_restart_finished_task(self):
+        """A task that already finished in this run is solved again."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("b",))
+        events = _EventLog()
+        pipeline = _pipeline(solver, events)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: "a" in events.task_ids(SolverEvents.COMPLETED))
+
+        assert await pipeline.request_restart_solver_task("a")
+        solver.release("b")
+        results = await run
+
+        assert [r.task["id"] for r in results] == ["a", "b"]
+        assert solver.attempts == {"a": 2, "b": 1}
+        assert events.task_ids(SolverEvents.COMPLETED).count("a") == 2
+
+
+@pytest.mark.unit
+class TestDependencyOrder:
+    """Test cases for dependency-ordered solving."""
+
+    @pytest.mark.asyncio
+    async def test_prerequisites_finish_first(self):
+        """Dependents start only after every prerequisite has finished."""
+        tasks = [
+            {"id": "c", "dependencies": ["a", "b"]},
+            {"id": "a"},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "d"},
+        ]
+        solver = _FakeSolver()
+
+        results = await _pipeline(solver, concurrency=4)._run_solvers(
+            tasks, _context(tasks)
+        )
+
+        assert [r.task["id"] for r in results] == ["c", "a", "b", "d"]
+        pos = {entry: i for i, entry in enumerate(solver.log)}
+        assert pos[("end", "a")] < pos[("start", "b")]
+        assert pos[("end", "b")] < pos[("start", "c")]
+
+    @pytest.mark.asyncio
+    async def test_blocked_tasks_are_cancelled(self):
+        """Tasks behind a failed prerequisite or a cycle get a blocked cancel event."""
+        tasks = [
+            {"id": "a"},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "x", "dependencies": ["y"]},
+            {"id": "y", "dependencies": ["x"]},
+            {"id": "d"},
+        ]
+        solver = _FakeSolver(failing=("a",))
+        events = _EventLog()
+
+        results = await _pipeline(solver, events)._run_solvers(tasks, _context(tasks))
+
+        assert [r.task["id"] for r in results] == ["d"]
+        assert ("start", "b") not in solver.log
+        blocked = [p for name, p in events.events if p.get("reason") == "blocked"]
+        assert sorted(p["task"]["id"] for p in blocked) == ["b", "x", "y"]
+        assert all(
+            name == SolverEvents.CANCELLED for name, p in events.events if p in blocked
+        )
+
+
+@pytest.mark.unit
+class TestPlanCache:
+    """Test cases for reusing planner output."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_planner(self):
+        """A repeated question reuses the cached tasks without planning again."""
+        planner = _FakePlanner([{"id": 1}, {"id": 2}])
+        pipeline = _pipeline(_FakeSolver(), planner=planner, plan_cache=PlanCache())
+
+        first = await pipeline.plan("hello")
+        second = await pipeline.plan("hello")
+        await pipeline.plan("other")
+
+        assert planner.requests == ["hello", "other"]
+        assert second.tasks == first.tasks
+        assert second.raw_plan_output == "plan"
+
+    @pytest.mark.asyncio
+    async def test_normalized_repeat_emits_cache_hit(self):
+        """Case and whitespace variants hit the cache and emit plan.cache_hit."""
+        planner = _FakePlanner([{"id": 1}, {"id": 2}])
+        events = _EventLog()
+        pipeline = _pipeline(
+            _FakeSolver(), events, planner=planner, plan_cache=PlanCache()
+        )
+
+        await pipeline.plan("Hello ")
+        await pipeline.plan("hello")
+
+        assert planner.requests == ["Hello "]
+        names = [name for name, _ in events.events]
+        assert names.count(PlanEvents.CACHE_HIT) == 1
+        assert names[-2:] == [PlanEvents.CACHE_HIT, PlanEvents.COMPLETED]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_replanned(self):
+        """Entries older than the ttl are dropped and the planner runs again."""
+        planner = _FakePlanner([{"id": 1}])
+        pipeline = _pipeline(
+            _FakeSolver(), planner=planner, plan_cache=PlanCache(ttl=0.05)
+        )
+
+        await pipeline.plan("hello")
+        await pipeline.plan("hello")
+        await asyncio.sleep(0.1)
+        await pipeline.plan("hello")
+
+        assert planner.requests == ["hello", "hello"]
+
+    def test_evicts_least_recently_used(self):
+        """Only the newest max_entries plans are kept."""
+        cache = PlanCache(max_entries=1)
+        entry = object()
+        cache.put("a", entry)
+        cache.put("b", entry)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is entry
+
+
+@pytest.mark.unit
+class TestSolverWarmup:
+    """Test cases for SolverAgent.warmup scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_runs_without_planning(self):
+        """Solving client-provided tasks still waits for the warmup."""
+
+        class _WarmSolver(_FakeSolver):
+            warmed = False
+
+            async def warmup(self) -> None:
+                await asyncio.sleep(0)
+                self.warmed = True
+
+            async def run_agent(self, task: Any, request: str) -> str:
+                assert self.warmed
+                return await super().run_agent(task, request)
+
+        tasks = [{"id": "a"}]
+        solver = _WarmSolver()
+
+        results = await _pipeline(solver)._run_solvers(tasks, _context(tasks))
+
+        assert solver.warmed
+        assert [r.task["id"] for r in results] == ["a"]
+
+
+@pytest.mark.unit
+class TestFailures:
+    """Test cases for failed solver tasks."""
+
+    @pytest.mark.asyncio
+    async def test_failed_task_is_left_out(self):
+        """By default a failed task is dropped from the results and reported."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        events = _EventLog()
+
+        results = await _pipeline(_FakeSolver(failing=("a",)), events)._run_solvers(
+            tasks, _context(tasks)
+        )
+
+        assert [r.task["id"] for r in results] == ["b"]
+        failed = [p for name, p in events.events if name == SolverEvents.STEP_FAILED]
+        assert [(p["task"]["id"], p["error_type"]) for p in failed] == [
+            ("a", "ValueError")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_record_failures(self):
+        """With record_failures a failed task is returned as an error result."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+
+        results = await _pipeline(
+            _FakeSolver(failing=("a",)), record_failures=True
+        )._run_solvers(tasks, _context(tasks))
+
+        assert [r.task["id"] for r in results] == ["a", "b"]
+        assert results[0].output is None
+        assert results[0].summary == "error: task a failed"
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_running_tasks(self):
+        """With task control, the first failure cancels the tasks still running."""
+        tasks = [{"id": "a"}, {"id": "b"}]
+        solver = _FakeSolver(gated=("b",), failing=("a",))
+        events = _EventLog()
+
+        with pytest.raises(ValueError, match="task a failed"):
+            await _pipeline(solver, events, fail_fast=True)._run_solvers(
+                tasks, _context(tasks)
+            )
+
+        assert ("end", "b") not in solver.log
+        assert events.task_ids(SolverEvents.CANCELLED) == ["b"]
+
+
+@pytest.mark.unit
+class TestWithoutTaskControl:
+    """Test cases for pipelines running with task_control disabled."""
+
+    @pytest.mark.asyncio
+    async def test_requests_refused_without_task_control(self):
+        """Cancel and restart are no-ops when task control is disabled."""
+        tasks = [{"id": "a"}]
+        solver = _FakeSolver(gated=("a",))
+        pipeline = _pipeline(solver, task_control=False)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", "a") in solver.log)
+
+        assert not await pipeline.request_cancel_solver_task("a")
+        assert not await pipeline.request_restart_solver_task("a")
+        solver.release("a")
+
+        assert [r.task["id"] for r in await run] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_without_task_control(self):
+        """Without task control, running tasks finish but queued ones are dropped."""
+        tasks = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        solver = _FakeSolver(gated=("b",), failing=("a",))
+        events = _EventLog()
+        pipeline = _pipeline(
+            solver, events, fail_fast=True, task_control=False, concurrency=2
+        )
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: events.task_ids(SolverEvents.STEP_FAILED) == ["a"])
+
+        solver.release("b")
+        with pytest.raises(ValueError, match="task a failed"):
+            await run
+
+        assert ("end", "b") in solver.log
+        assert ("start", "c") not in solver.log
+
+
+@pytest.mark.unit
+class TestDedupeRequests:
+    """Test cases for sharing one solve among identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_solve_once(self):
+        """Followers reuse the leader's result without its statistics."""
+        tasks = [
+            {"id": 0, "request": "x"},
+            {"id": 1, "request": "x"},
+            {"id": 2, "request": "y"},
+        ]
+        solver = _FakeSolver()
+
+        results = await _pipeline(solver, dedupe_requests=True)._run_solvers(
+            tasks, _context(tasks)
+        )
+
+        assert [(r.task["id"], r.output) for r in results] == [
+            (0, "out:x"),
+            (1, "out:x"),
+            (2, "out:y"),
+        ]
+        assert solver.attempts == {0: 1, 2: 1}
+
+    @pytest.mark.asyncio
+    async def test_follower_solves_when_leader_cancelled(self):
+        """Cancelling the leader makes a waiting follower solve on its own."""
+        tasks = [{"id": 0, "request": "x"}, {"id": 1, "request": "x"}]
+        solver = _FakeSolver(gated=(0,))
+        pipeline = _pipeline(solver, dedupe_requests=True)
+        run = asyncio.create_task(pipeline._run_solvers(tasks, _context(tasks)))
+        await _until(lambda: ("start", 0) in solver.log)
+        # Let the follower reach the shared solve before the leader goes away
+        await asyncio.sleep(0)
+        assert ("start", 1) not in solver.log
+
+        assert await pipeline.request_cancel_solver_task(0)
+        results = await run
+
+        assert [(r.task["id"], r.output) for r in results] == [(1, "out:x")]
+        assert solver.attempts == {0: 1, 1: 1}
+
+
+class _CleanupTool(BaseTool):
+    """Records each use and cleanup; the log list is shared by its copies."""
+
+    name: str = "probe"
+    description: str = "Sleeps for the given delay."
+    log: list[tuple[Any, ...]] = Field(default_factory=list)
+    closed: bool = False
+
+    async def execute(self, delay: float = 0.0) -> ToolResult:
+        await asyncio.sleep(delay)
+        self.log.append(("execute", id(self), self.closed))
+        return ToolResult(output="ok")
+
+    async def cleanup(self) -> None:
+        self.closed = True
+        self.log.append(("cleanup", id(self)))
+
+
+class _ToolAgent(ToolCallAgent):
+    async def step(self) -> str:
+        # The request is the delay the probe tool sleeps for
+        delay = float(self.memory.messages[0].content)
+        await self.available_tools.execute(name="probe", tool_input={"delay": delay})
+        self.state = AgentState.FINISHED
+        return f"slept {delay}"
+
+
+class _PooledSolver(SolverAgent):
+    """Builds tool agents that every task may share."""
+
+    def __init__(self, pool_key: Any = "shared") -> None:
+        super().__init__("pooled_solver")
+        self.pool_key = pool_key
+        self.tool = _CleanupTool()
+        self.built: list[Any] = []
+
+    def build_agent(self, task: Any, *, context: PlanContext) -> _ToolAgent:
+        self.built.append(task["id"])
+        # model_construct skips building a default LLM client
+        return _ToolAgent.model_construct(
+            name="tool_agent",
+            llm=None,
+            memory=Memory(),
+            available_tools=ToolCollection(self.tool),
+        )
+
+    def agent_pool_key(self, task: Any, *, context: PlanContext) -> Any:
+        return self.pool_key
+
+    def build_request(self, task: Any, *, context: PlanContext) -> str:
+        return str(task["delay"])
+
+    def extract_result(
+        self, agent: Any, solver_output: str, task: Any, *, context: PlanContext
+    ) -> str:
+        return solver_output
+
+
+@pytest.mark.unit
+class TestSolverAgentPool:
+    """Test cases for reusing solver agents across tasks."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_copies_keep_their_own_tools(self):
+        """A solver finishing first must not clean up tools a sibling still uses."""
+        tasks = [{"id": "slow", "delay": 0.05}, {"id": "fast", "delay": 0}]
+        solver = _PooledSolver()
+
+        results = await _pipeline(solver, reuse_solver_agents=True)._run_solvers(
+            tasks, _context(tasks)
+        )
+
+        assert [r.task["id"] for r in results] == ["slow", "fast"]
+        assert solver.built == ["slow"]
+        log = solver.tool.log
+        executes = [entry for entry in log if entry[0] == "execute"]
+        cleanups = [entry[1] for entry in log if entry[0] == "cleanup"]
+        assert len(executes) == 2
+        assert not any(closed for _, _, closed in executes)
+        assert len(set(cleanups)) == 2
+        assert id(solver.tool) not in cleanups
+        assert not solver.tool.closed
+
+    @pytest.mark.asyncio
+    async def test_no_pool_key_builds_per_task(self):
+        """Without an agent_pool_key every task gets its own built agent."""
+        tasks = [{"id": "a", "delay": 0}, {"id": "b", "delay": 0}]
+        solver = _PooledSolver(pool_key=None)
+
+        await _pipeline(solver, reuse_solver_agents=True)._run_solvers(
+            tasks, _context(tasks)
+        )
+
+        assert solver.built == ["a", "b"]
+
+
+def _recursive_serializable(value: Any) -> Any:
+    """The recursive converter _make_serializable replaced."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, dict):
+        return {k: _recursive_serializable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_recursive_serializable(v) for v in value]
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "__dict__"):
+        return {
+            k: _recursive_serializable(v)
+            for k, v in vars(value).items()
+            if not k.startswith("_")
+        }
+    return str(value)
+
+
+@dataclass
+class _Slide:
+    id: int
+    title: str
+    notes: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Deck:
+    slides: list[_Slide]
+    meta: dict[str, Any]
+
+
+class _Usage(BaseModel):
+    model: str
+    tokens: int
+
+
+class _Record:
+    def __init__(self) -> None:
+        self.name = "record"
+        self.values = [1, 2.5, None]
+        self._private = "hidden"
+
+
+@pytest.mark.unit
+class TestMakeSerializable:
+    """Test cases for the iterative payload converter."""
+
+    def test_matches_recursive_output(self):
+        """Event payloads convert to the same JSON as the recursive version."""
+        payload = {
+            "task": _Slide(1, "Intro", ["a", "b"]),
+            "deck": _Deck([_Slide(2, "Body")], {"theme": "dark", "sizes": [1, 2]}),
+            "usage": _Usage(model="m", tokens=3),
+            "record": _Record(),
+            "tags": {"x"},
+            "pairs": [(1, "one"), (2, "two")],
+            "amount": Decimal("1.50"),
+            "statistics": [{"model": "m", "tokens": 3, "nested": {"ok": True}}],
+            "empty": None,
+        }
+
+        expected = json.dumps(_recursive_serializable(payload), sort_keys=True)
+
+        assert json.dumps(_make_serializable(payload), sort_keys=True) == expected
+        assert _make_serializable("plain") == "plain"
+
+    def test_does_not_alias_input(self):
+        """Containers in the output are copies, not the payload's own objects."""
+        stats = [{"model": "m"}]
+        payload = {"statistics": stats}
+
+        out = _make_serializable(payload)
+
+        assert out == payload
+        assert out["statistics"] is not stats
+        assert out["statistics"][0] is not stats[0]
+
+    def test_self_reference_raises(self):
+        """Cyclic payloads fail like the recursive converter did."""
+        payload: dict[str, Any] = {}
+        payload["self"] = payload
+
+        with pytest.raises(RecursionError):
+            _make_serializable(payload)
@@ -0,0 +1,148 @@
+"""Unit tests for WebSocket event encoding and binary frames."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from myagent.ws import utils
+from myagent.ws.outbound import OutboundChannel
+from myagent.ws.server import AgentWebSocketServer
+from myagent.ws.utils import dumps_event
+from myagent.ws.utils import encode_event
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+class _Model(BaseModel):
+    name: str
+
+
+class _Opaque:
+    def __init__(self):
+        self.secret = "value"
+
+
+_EXPECTED = (
+    '{"text":"你好","at":"2026-01-02T03:04:05","id":'
+    '"00000000-0000-0000-0000-000000000001","color":"red",'
+    '"point":{"x":1,"y":2},"model":{"name":"m"},"tags":["a"],"1":"int key"}'
+)
+
+
+def _event() -> dict:
+    return {
+        "text": "你好",
+        "at": datetime(2026, 1, 2, 3, 4, 5),
+        "id": UUID(int=1),
+        "color": _Color.RED,
+        "point": _Point(1, 2),
+        "model": _Model(name="m"),
+        "tags": {"a"},
+        1: "int key",
+    }
+
+
+class _FakeWebSocket:
+    """Records sent frames; iterating ends once a frame has been sent."""
+
+    close_code = None
+
+    def __init__(self):
+        self.frames: list[str | bytes] = []
+        self.sent = asyncio.Event()
+
+    async def send(self, frame):
+        self.frames.append(frame)
+        self.sent.set()
+
+    async def __aiter__(self):
+        await asyncio.wait_for(self.sent.wait(), timeout=1)
+        return
+        yield
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test against orjson and against the json.dumps fallback."""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+@pytest.mark.unit
+class TestDumpsEvent:
+    """Test cases for dumps_event on both encoders."""
+
+    def test_encodes_supported_types(self, encoder):
+        """Both encoders produce the same compact, UTF-8 text."""
+        assert dumps_event(_event()) == _EXPECTED
+
+    def test_unknown_type_raises(self, encoder):
+        """Unsupported objects raise instead of being stringified."""
+        with pytest.raises(TypeError, match="_Opaque"):
+            dumps_event({"value": _Opaque()})
+
+    def test_big_int_uses_fallback(self, encoder):
+        """Integers beyond 64 bits still encode."""
+        assert json.loads(dumps_event({"n": 2**70})) == {"n": 2**70}
+
+
+@pytest.mark.unit
+class TestBinaryFrames:
+    """Test cases for binary frame encoding and its wiring."""
+
+    def test_encode_event_binary_is_utf8_bytes(self, encoder):
+        """Binary frames carry the text frame's JSON as UTF-8 bytes."""
+        frame = encode_event(_event(), binary=True)
+
+        assert isinstance(frame, bytes)
+        assert frame.decode("utf-8") == _EXPECTED
+        assert encode_event(_event()) == _EXPECTED
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("binary", [False, True])
+    async def test_outbound_channel_frame_type(self, binary):
+        """The outbound writer sends bytes only when binary is set."""
+        websocket = _FakeWebSocket()
+        channel = OutboundChannel(websocket, coalesce_window_ms=0, binary=binary)
+        channel.start()
+
+        await channel.enqueue({"event": "ping", "content": "é"})
+        await asyncio.wait_for(channel.queue.join(), timeout=1)
+        await channel.close()
+
+        (frame,) = websocket.frames
+        assert isinstance(frame, bytes) is binary
+        text = frame.decode() if binary else frame
+        assert json.loads(text) == {"event": "ping", "content": "é"}
+
+    @pytest.mark.asyncio
+    async def test_server_binary_frames(self):
+        """binary_frames makes the server send its events as bytes."""
+        server = AgentWebSocketServer(
+            lambda: None, state_secret_key="secret", binary_frames=True
+        )
+        websocket = _FakeWebSocket()
+
+        await server.handle_connection(websocket)
+
+        (frame,) = websocket.frames
+        assert isinstance(frame, bytes)
+        assert json.loads(frame)["event"] == "system.connected"